@@ -1,17 +1,83 @@
 # ============================================================
-# ======================= IMPORTS ============================
+# ==================== IMPORT PROFILING ======================
 # ============================================================
 
+# Installed before any other import so the whole startup is measured;
+# these three are built in and already loaded.
 import sys
-import os
 import time
+import builtins
+import _thread
+
+APP_START = time.perf_counter()
+
+STARTUP_BUDGET_SECONDS = 1.5
+
+
+class ImportProfiler:
+    # Records the cumulative wall time (children included) of the first
+    # import of every absolute module name while installed. The total
+    # only counts outermost imports, so nested ones are not counted twice.
+    def __init__(self):
+        self.records = {}
+        self.outer = {}
+        self.depth = {}
+        self._import = builtins.__import__
+
+    def install(self):
+        builtins.__import__ = self._timed_import
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules:
+            return self._import(name, globals, locals, fromlist, level)
+        thread = _thread.get_ident()
+        depth = self.depth.get(thread, 0)
+        self.depth[thread] = depth + 1
+        start = time.perf_counter()
+        try:
+            return self._import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.depth[thread] = depth
+            self.records.setdefault(name, elapsed)
+            if depth == 0:
+                self.outer[name] = self.outer.get(name, 0.0) + elapsed
+
+    def report(self, title, top=25):
+        print(f"[imports] {title}: {sum(self.outer.values()):.3f}s in "
+              f"{len(self.outer)} outermost imports (cumulative times below)")
+        for name, seconds in sorted(self.records.items(), key=lambda kv: -kv[1])[:top]:
+            print(f"  {seconds * 1000:9.1f} ms  {name}")
+
+
+import_profiler = None
+if "--profile-imports" in sys.argv:
+    import_profiler = ImportProfiler()
+    import_profiler.install()
+
+
+# ============================================================
+# ======================= IMPORTS ============================
+# ============================================================
+
+import os
 import math
+import json
+import copy
+import hashlib
+import contextlib
+import argparse
 import platform
-import cv2
-import numpy as np
-
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QImage, QPixmap, QIcon
+import queue
+import base64
+import threading
+import datetime
+import tracemalloc
+import gc
+import random
+
+from PyQt6.QtCore import Qt, QTimer, QThread, QFileSystemWatcher, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap, QIcon, QPainter
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -23,7 +89,10 @@ from PyQt6.QtWidgets import (
     QStackedLayout
 )
 
-from mmpose.apis import MMPoseInferencer
+try:
+    import tomllib   # Python 3.11+
+except ImportError:
+    tomllib = None
 
 # ============================================================
 # =============== PYINSTALLER RESOURCE HELPER =================
@@ -49,26 +118,837 @@ FOOTBALL_IMAGE = resource_path("ball.png")
 PLAY_BUTTON_IMAGE = resource_path("play1.png")
 EXIT_BUTTON_IMAGE = resource_path("exit1.png")
 
+APP_DATA_DIR = os.path.join(os.path.expanduser("~"), "KickSitStand")
+PROFILE_DIR = os.path.join(APP_DATA_DIR, "profiles")
+CALIBRATION_DIR = os.path.join(APP_DATA_DIR, "calibration")
+MODEL_CACHE_DIR = os.path.join(APP_DATA_DIR, "models")
+RECORDING_DIR = os.path.join(APP_DATA_DIR, "recordings")
+
 
 
 # ============================================================
 # ======================= GLOBAL STATE =======================
 # ============================================================
 
-FLIP_FRAME = True
+selected_posture = "standing"
+selected_difficulty = 1
+selected_session_seconds = 30
+recalibrate_next_session = False
+rebuild_model_cache = False
+use_fused_model = False
+inference_precision = "fp32"
+recording_options = None
+monitor_server = None
+memory_debug = False
+frame_stats = False
+use_roi_cache = True
+inference_cpus = None
+sound_enabled = True
 
-SESSION_TIME_SECONDS = 30
 
-BALL_HORIZONTAL_OFFSET = 80
-BALL_RADIUS = 35
-HIT_RADIUS = BALL_RADIUS
-HOLD_TIME = 0.5
-MIN_KICK_INTERVAL = 0.3
+# ============================================================
+# ======================= GAME RULES =========================
+# ============================================================
 
-DIFFICULTY_MAP = {1: 0, 2: 15, 3: 30}
+# Built-in rules; a patient profile overrides any subset of these keys.
+# Ball lengths are in body units (hip widths, measured at calibration).
+DEFAULT_PROFILE = {
+    "camera": {
+        "flip": True
+    },
+    "session": {
+        "seconds": 30,
+        "min_seconds": 10,
+        "max_seconds": 120,
+        "step_seconds": 5
+    },
+    "ball": {
+        "pattern": "alternate",     # "alternate", "left", "right" or a list of sides
+        "horizontal_offset": 1.3,
+        "sitting_offset_scale": 0.6,
+        "radius": 0.6,
+        "hit_radius": 0.6
+    },
+    "hold": {
+        "hold_time": 0.5,
+        "min_kick_interval": 0.3
+    },
+    "difficulty": {
+        "heights": [0, 0.25, 0.5],  # ball height above hip per level
+        "kicks_per_step": 0,        # 0 disables progressive difficulty
+        "step_height": 0.0,
+        "max_steps": 0
+    }
+}
 
-selected_posture = "standing"
-selected_difficulty = 1
+SIDE_LEFT = 0
+SIDE_RIGHT = 1
+
+POSTURES = ("standing", "sitting")
+
+
+class RuleTable:
+    # Flat, precompiled rules for one posture/difficulty pair.
+    # The game loop only reads these attributes.
+    __slots__ = (
+        "flip", "sides", "offset", "ball_radius", "hit_radius_sq",
+        "hold_time", "min_kick_interval", "heights", "kicks_per_step"
+    )
+
+    def __init__(self, profile, posture, difficulty):
+        ball = profile["ball"]
+        hold = profile["hold"]
+        diff = profile["difficulty"]
+
+        self.flip = bool(profile["camera"]["flip"])
+        self.sides = compile_pattern(ball["pattern"])
+
+        offset = float(ball["horizontal_offset"])
+        if posture == "sitting":
+            offset *= float(ball["sitting_offset_scale"])
+        self.offset = offset
+
+        self.ball_radius = float(ball["radius"])
+        self.hit_radius_sq = float(ball["hit_radius"]) ** 2
+        self.hold_time = float(hold["hold_time"])
+        self.min_kick_interval = float(hold["min_kick_interval"])
+
+        heights = [float(h) for h in diff["heights"]]
+        base = heights[min(difficulty, len(heights)) - 1]
+        steps = int(diff["max_steps"]) if int(diff["kicks_per_step"]) > 0 else 0
+        self.heights = tuple(base + i * float(diff["step_height"]) for i in range(steps + 1))
+        self.kicks_per_step = int(diff["kicks_per_step"])
+
+    def scaled(self, unit):
+        # Copy with body-unit lengths converted to pixels
+        table = object.__new__(RuleTable)
+        for name in RuleTable.__slots__:
+            setattr(table, name, getattr(self, name))
+        table.offset = self.offset * unit
+        table.ball_radius = max(1, int(round(self.ball_radius * unit)))
+        table.hit_radius_sq = self.hit_radius_sq * unit * unit
+        table.heights = tuple(h * unit for h in self.heights)
+        return table
+
+
+def compile_pattern(pattern):
+    names = {"left": SIDE_LEFT, "right": SIDE_RIGHT}
+    if pattern == "alternate":
+        return (SIDE_LEFT, SIDE_RIGHT)
+    if isinstance(pattern, str):
+        pattern = [pattern]
+    for p in pattern:
+        if p not in names:
+            raise ValueError(f"unknown ball side in pattern: {p!r}")
+    if not pattern:
+        raise ValueError("ball pattern is empty")
+    return tuple(names[p] for p in pattern)
+
+
+def merge_profile(base, override):
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            merged[key] = merge_profile(base[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def read_profile(path):
+    if path.endswith(".toml"):
+        if tomllib is None:
+            raise RuntimeError("TOML profiles need Python 3.11+, use JSON instead")
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def find_profile(name):
+    if os.path.isfile(name):
+        return os.path.abspath(name)
+    for ext in (".toml", ".json"):
+        path = os.path.join(PROFILE_DIR, name + ext)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+class RulesEngine:
+    def __init__(self):
+        self.path = None
+        self.mtime = None
+        self.profile = DEFAULT_PROFILE
+        self.tables = self.compile(DEFAULT_PROFILE)
+
+    def compile(self, profile):
+        levels = len(profile["difficulty"]["heights"])
+        return {
+            (posture, lvl): RuleTable(profile, posture, lvl)
+            for posture in POSTURES
+            for lvl in range(1, max(levels, 3) + 1)
+        }
+
+    def load(self, path):
+        profile = merge_profile(DEFAULT_PROFILE, read_profile(path))
+        tables = self.compile(profile)   # raises before anything is replaced
+        self.path = path
+        self.mtime = os.path.getmtime(path)
+        self.profile = profile
+        self.tables = tables
+
+    def reload(self):
+        if self.path is None or not os.path.isfile(self.path):
+            return False
+        if os.path.getmtime(self.path) == self.mtime:
+            return False
+        try:
+            self.load(self.path)
+        except Exception as e:
+            print(f"[rules] keeping previous profile, reload failed: {e}")
+            return False
+        return True
+
+    def table(self, posture, difficulty):
+        return self.tables[(posture, difficulty)]
+
+    @property
+    def name(self):
+        if self.path is None:
+            return "default"
+        return os.path.splitext(os.path.basename(self.path))[0]
+
+    def session_limits(self):
+        session = self.profile["session"]
+        return (
+            int(session["min_seconds"]),
+            int(session["max_seconds"]),
+            int(session["step_seconds"])
+        )
+
+
+RULES = RulesEngine()
+
+
+# ============================================================
+# ===================== VISION STACK =========================
+# ============================================================
+
+# OpenCV, NumPy and MMPose (torch, mmengine, mmcv, mmdet) take seconds to
+# import, so they are loaded in the background after the splash is up.
+cv2 = None
+np = None
+MMPoseInferencer = None
+
+
+def load_vision_stack(with_pose=True):
+    global cv2, np, MMPoseInferencer
+
+    import cv2 as _cv2
+    import numpy as _np
+    cv2, np = _cv2, _np
+
+    if with_pose:
+        from mmpose.apis import MMPoseInferencer as _MMPoseInferencer
+        MMPoseInferencer = _MMPoseInferencer
+
+
+class VisionLoader(QThread):
+    ready = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, threads=None, parent=None):
+        super().__init__(parent)
+        self.threads = threads
+
+    def run(self):
+        try:
+            pin_inference_thread()
+            load_vision_stack()
+            configure_cpu(self.threads)
+            backend = create_pose_backend()
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.ready.emit(backend)
+
+
+# ============================================================
+# ====================== PREPROCESSING =======================
+# ============================================================
+
+ROI_GRID = 8                # px; ROI centre and width snap to this grid
+ROI_PADDING = 1.25          # person box padding, as in MMPose's GetBBoxCenterScale
+ROI_REDETECT_FRAMES = 30    # run the person detector at least this often
+ROI_CACHE_SIZE = 16
+RTMPOSE_INPUT_SIZE = (192, 256)
+RTMPOSE_MEAN = (123.675, 116.28, 103.53)
+RTMPOSE_STD = (58.395, 57.12, 57.375)
+
+
+def input_tensor(shape):
+    # Float32 model input, page-locked when CUDA is present so the
+    # host-to-device copy can run asynchronously. Returns (tensor, array
+    # view); without torch (benchmark only) the tensor is None.
+    try:
+        import torch
+    except ImportError:
+        return None, np.empty(shape, np.float32)
+    tensor = torch.empty(shape, dtype=torch.float32, pin_memory=torch.cuda.is_available())
+    return tensor, tensor.numpy()
+
+
+def roi_from_bbox(bbox, input_size):
+    # Padded person box widened to the model aspect ratio and snapped to
+    # ROI_GRID, so small detector jitter maps to the same (cx, cy, width)
+    x1, y1, x2, y2 = (float(v) for v in bbox[:4])
+    w, h = input_size
+    width = max((x2 - x1), (y2 - y1) * w / h) * ROI_PADDING
+    snap = lambda v: int(round(v / ROI_GRID)) * ROI_GRID
+    return snap((x1 + x2) / 2), snap((y1 + y2) / 2), max(ROI_GRID, snap(width))
+
+
+def warp_matrix(roi, input_size):
+    cx, cy, width = roi
+    w, h = input_size
+    k = w / width
+    return np.array([[k, 0.0, w / 2 - k * cx], [0.0, k, h / 2 - k * cy]])
+
+
+class PosePreprocessor:
+    # Crops and resizes the ROI with one cv2.warpAffine into a uint8
+    # buffer, then normalises and transposes in place into a reused
+    # float32 input tensor. Warp matrices are cached per snapped ROI.
+    def __init__(self, input_size=RTMPOSE_INPUT_SIZE, mean=RTMPOSE_MEAN, std=RTMPOSE_STD,
+                 bgr_to_rgb=True):
+        w, h = input_size
+        self.input_size = (w, h)
+        self.warped = np.empty((h, w, 3), np.uint8)
+        self.scaled = np.empty((h, w, 3), np.float32)
+        self.tensor, self.array = input_tensor((1, 3, h, w))
+        self.chw = self.array[0]
+
+        # Frames are BGR: work in frame channel order, swap on transpose.
+        # cv2 scalars, since numpy broadcasting allocates per call.
+        mean = [float(v) for v in mean]
+        std = [float(v) for v in std]
+        if bgr_to_rgb:
+            mean, std = mean[::-1], std[::-1]
+        self.mean = tuple(mean) + (0.0,)
+        self.inv_std = tuple(1.0 / v for v in std) + (1.0,)
+        planes = self.scaled.transpose(2, 0, 1)
+        self.planes = planes[::-1] if bgr_to_rgb else planes
+        self.matrices = {}
+
+    def matrix(self, roi):
+        m = self.matrices.get(roi)
+        if m is None:
+            if len(self.matrices) >= ROI_CACHE_SIZE:
+                self.matrices.clear()
+            m = warp_matrix(roi, self.input_size)
+            self.matrices[roi] = m
+        return m
+
+    def __call__(self, frame, roi):
+        cv2.warpAffine(frame, self.matrix(roi), self.input_size, dst=self.warped,
+                       flags=cv2.INTER_LINEAR)
+        np.copyto(self.scaled, self.warped, casting="unsafe")
+        cv2.subtract(self.scaled, self.mean, dst=self.scaled)
+        cv2.multiply(self.scaled, self.inv_std, dst=self.scaled)
+        np.copyto(self.chw, self.planes)
+        return self.array if self.tensor is None else self.tensor
+
+
+def preprocess_per_frame(frame, roi, input_size, mean, std):
+    # Reference for the benchmark: the allocate-every-step path
+    flipped = cv2.flip(frame, 1)
+    warped = cv2.warpAffine(flipped, warp_matrix(roi, input_size), input_size,
+                            flags=cv2.INTER_LINEAR)
+    img = (warped[:, :, ::-1].astype(np.float32) - mean) / std
+    return np.ascontiguousarray(img.transpose(2, 0, 1))[None]
+
+
+def bench_preprocess(frames, size=(640, 480)):
+    # Flip + crop/resize + normalise + layout, allocating vs preallocated;
+    # tracemalloc counts the bytes each frame allocates.
+    w, h = size
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (h, w, 3), dtype=np.uint8)
+    roi = roi_from_bbox((w * 0.3, h * 0.1, w * 0.7, h * 0.95), RTMPOSE_INPUT_SIZE)
+    mean = np.array(RTMPOSE_MEAN, np.float32)
+    std = np.array(RTMPOSE_STD, np.float32)
+
+    prep = PosePreprocessor()
+    buffers = FrameBuffers()
+
+    def cached():
+        flipped = cv2.flip(frame, 1, dst=buffers.get("flipped", frame.shape))
+        return prep(flipped, roi)
+
+    def per_frame():
+        return preprocess_per_frame(frame, roi, RTMPOSE_INPUT_SIZE, mean, std)
+
+    diff = np.abs(np.asarray(cached()) - per_frame()).max()
+
+    print(f"[preprocess] {w}x{h} -> {RTMPOSE_INPUT_SIZE[0]}x{RTMPOSE_INPUT_SIZE[1]}, "
+          f"{frames} frames, max difference {diff:.2e}")
+    variants = (("allocating", per_frame), ("preallocated", cached))
+
+    # Timing first, with tracemalloc off for both variants
+    was_tracing = tracemalloc.is_tracing()
+    tracemalloc.stop()
+    timings = {}
+    for name, step in variants:
+        for _ in range(10):
+            step()
+        start = time.perf_counter()
+        for _ in range(frames):
+            step()
+        timings[name] = (time.perf_counter() - start) / frames
+
+    for name, step in variants:
+        monitor = AllocationMonitor(every=1)
+        for _ in range(frames):
+            monitor.before_tick()
+            step()
+            monitor.after_tick()
+        alloc = monitor.summary()
+        tracemalloc.stop()
+
+        print(f"  {name:<13}: {timings[name] * 1000:.3f} ms/frame, "
+              f"{alloc['avg_tick_bytes']:,} bytes allocated per frame "
+              f"(max {alloc['max_tick_bytes']:,})")
+
+    if was_tracing:
+        tracemalloc.start()
+    return 0
+
+
+# ============================================================
+# ======================= POSE BACKEND =======================
+# ============================================================
+
+MODEL_MANIFEST_VERSION = 1
+
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def strip_init_cfg(cfg):
+    # Pretrained init_cfg entries point at URLs; weights come from the cache
+    if isinstance(cfg, dict):
+        cfg.pop("init_cfg", None)
+        for value in cfg.values():
+            strip_init_cfg(value)
+    elif isinstance(cfg, list):
+        for value in cfg:
+            strip_init_cfg(value)
+    return cfg
+
+
+class ModelCache:
+    # Resolved configs and checkpoints for the "human" alias, stored
+    # at a fixed path and checked by SHA-256 before use, so startup
+    # never has to resolve aliases or download anything.
+    def __init__(self, root=MODEL_CACHE_DIR):
+        self.root = root
+        self.manifest_path = os.path.join(root, "manifest.json")
+
+    def path(self, name):
+        return os.path.join(self.root, name)
+
+    def load_manifest(self):
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if manifest.get("version") != MODEL_MANIFEST_VERSION:
+            return None
+        return manifest
+
+    def validate(self, manifest):
+        for name, digest in manifest["files"].items():
+            path = self.path(name)
+            if not os.path.isfile(path) or file_sha256(path) != digest:
+                print(f"[models] cache entry invalid: {name}")
+                return False
+        return True
+
+    def build(self, inferencer, fused=False):
+        import torch
+        from mmengine.config import Config
+
+        os.makedirs(self.root, exist_ok=True)
+        pose = inferencer.inferencer
+        det = pose.detector
+
+        files = {}
+        for prefix, part in (("pose2d", pose), ("det", det)):
+            config = f"{prefix}_config.py"
+            weights = f"{prefix}_weights.pth"
+
+            cfg = Config(strip_init_cfg(part.cfg.to_dict()))
+            cfg.dump(self.path(config))
+            torch.save(
+                {
+                    "state_dict": part.model.state_dict(),
+                    "meta": {"dataset_meta": part.model.dataset_meta}
+                },
+                self.path(weights)
+            )
+            files[config] = None
+            files[weights] = None
+
+        if fused:
+            torch.save(fuse_pose_model(pose.model), self.path("pose2d_fused.pt"))
+            files["pose2d_fused.pt"] = None
+
+        for name in files:
+            files[name] = file_sha256(self.path(name))
+
+        manifest = {
+            "version": MODEL_MANIFEST_VERSION,
+            "det_cat_ids": list(pose.det_cat_ids),
+            "files": files
+        }
+        with open(self.manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        print(f"[models] cache written to {self.root}")
+
+    def create_inferencer(self, manifest):
+        fused = use_fused_model and "pose2d_fused.pt" in manifest["files"]
+        with self.preloaded_pose_model() if fused else contextlib.nullcontext():
+            return MMPoseInferencer(
+                pose2d=self.path("pose2d_config.py"),
+                pose2d_weights=self.path("pose2d_weights.pth"),
+                det_model=self.path("det_config.py"),
+                det_weights=self.path("det_weights.pth"),
+                det_cat_ids=manifest["det_cat_ids"]
+            )
+
+    @contextlib.contextmanager
+    def preloaded_pose_model(self):
+        # Has Pose2DInferencer unpickle the fused module instead of building
+        # the pose model from its config and loading the .pth into it
+        import torch
+        from mmpose.apis.inferencers import Pose2DInferencer
+
+        path = self.path("pose2d_fused.pt")
+
+        def init_model(inferencer, cfg, weights, device=None):
+            if device is None:
+                device = "cuda" if torch.cuda.is_available() else "cpu"
+            model = torch.load(path, map_location=device, weights_only=False)
+            model.eval()
+            return model
+
+        original = Pose2DInferencer._init_model
+        Pose2DInferencer._init_model = init_model
+        try:
+            yield
+        finally:
+            Pose2DInferencer._init_model = original
+
+    def apply_fused(self, inferencer):
+        import torch
+
+        pose = inferencer.inferencer
+        model = torch.load(
+            self.path("pose2d_fused.pt"),
+            map_location=next(pose.model.parameters()).device,
+            weights_only=False
+        )
+        model.eval()
+        pose.model = model
+
+
+def fuse_pose_model(model):
+    from mmcv.cnn import fuse_conv_bn
+
+    fused = fuse_conv_bn(copy.deepcopy(model).eval())
+    fused.eval()
+    return fused
+
+
+def cpu_supports_bf16():
+    import torch
+    try:
+        return bool(torch.ops.mkldnn._is_mkldnn_bf16_supported())
+    except (AttributeError, RuntimeError):
+        return False
+
+
+def parse_cpu_list(text):
+    # "0-2,5" -> {0, 1, 2, 5}
+    cpus = set()
+    for part in text.split(","):
+        if "-" in part:
+            lo, hi = part.split("-")
+            cpus.update(range(int(lo), int(hi) + 1))
+        elif part.strip():
+            cpus.add(int(part))
+    return cpus
+
+
+def pin_inference_thread():
+    # Pins the calling thread (Linux: per thread) and the torch/OpenMP
+    # workers it later starts; the Qt GUI thread is left unpinned
+    if inference_cpus:
+        os.sched_setaffinity(0, inference_cpus)
+
+
+def configure_cpu(threads=None):
+    if threads:
+        import torch
+        torch.set_num_threads(threads)
+
+
+class PoseBackend:
+    # Wraps the inferencer with the selected CPU precision:
+    # "fp32", "int8" (dynamic quantization) or "bf16" (autocast).
+    # With the ROI cache, the full MMPose pipeline (person detector and
+    # its own preprocessing) only runs to find the person; in between,
+    # frames go through PosePreprocessor straight into the pose model.
+    def __init__(self, inferencer, precision="fp32", roi_cache=True):
+        self.inferencer = inferencer
+        self.precision = "fp32"
+        self.autocast = contextlib.nullcontext
+        self.set_precision(precision)
+
+        self.preprocessor = None
+        self.roi = None
+        self.roi_age = 0
+        self.samples = {}
+        if roi_cache:
+            try:
+                self.enable_roi_cache()
+            except Exception as e:
+                print(f"[preprocess] ROI cache unavailable, using the full pipeline: {e}")
+                self.preprocessor = None
+
+    def enable_roi_cache(self):
+        import torch
+
+        pose = self.inferencer.inferencer
+        model = pose.model
+        input_size = RTMPOSE_INPUT_SIZE
+        for step in pose.cfg.test_dataloader.dataset.pipeline:
+            if step["type"] == "TopdownAffine":
+                input_size = tuple(step["input_size"])
+
+        data_pre = model.data_preprocessor
+        self.preprocessor = PosePreprocessor(
+            input_size,
+            data_pre.mean.view(-1).tolist(),
+            data_pre.std.view(-1).tolist(),
+            getattr(data_pre, "_channel_conversion", True)
+        )
+        self.torch = torch
+        self.flip_indices = model.dataset_meta["flip_indices"]
+
+        device = next(model.parameters()).device
+        self.device_input = None
+        if device.type != "cpu":
+            self.device_input = torch.empty(self.preprocessor.tensor.shape, device=device)
+
+    def set_precision(self, precision):
+        if precision == self.precision:
+            return
+        if precision == "fp32":
+            if self.precision == "int8":
+                raise ValueError("int8 quantization cannot be undone")
+            self.autocast = contextlib.nullcontext
+            self.precision = "fp32"
+            return
+
+        import torch
+
+        pose = self.inferencer.inferencer
+        if next(pose.model.parameters()).device.type != "cpu":
+            print(f"[precision] {precision} only applies to CPU inference, using fp32")
+            return
+
+        if precision == "int8":
+            for part in (pose, pose.detector):
+                part.model = torch.ao.quantization.quantize_dynamic(
+                    part.model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+        elif precision == "bf16":
+            if not cpu_supports_bf16():
+                print("[precision] this CPU has no bfloat16 support, using fp32")
+                return
+            self.autocast = lambda: torch.autocast("cpu", dtype=torch.bfloat16)
+        else:
+            raise ValueError(f"unknown precision: {precision}")
+
+        self.precision = precision
+
+    def __call__(self, frame):
+        if self.preprocessor is None or self.roi is None or self.roi_age >= ROI_REDETECT_FRAMES:
+            return self.detect(frame)
+        try:
+            return self.predict_roi(frame)
+        except Exception as e:
+            print(f"[preprocess] ROI cache disabled, using the full pipeline: {e}")
+            self.preprocessor = None
+            return self.detect(frame)
+
+    def detect(self, frame):
+        with self.autocast():
+            result = next(self.inferencer(frame, show=False))
+        preds = result.get("predictions", [])
+        if self.preprocessor is not None:
+            self.roi = self.pick_roi(preds)
+            self.roi_age = 0
+        return preds
+
+    def pick_roi(self, preds):
+        best = None
+        best_score = KEYPOINT_SCORE_THRESHOLD
+        for inst in (preds[0] if preds else ()):
+            scores = inst.get("keypoint_scores")
+            bbox = inst.get("bbox")
+            if scores is None or len(scores) < 15 or bbox is None:
+                continue
+            score = min(float(scores[i]) for i in LOWER_BODY)
+            if score >= best_score:
+                best = np.asarray(bbox, dtype=np.float64).reshape(-1)
+                best_score = score
+        if best is None:
+            return None
+        return roi_from_bbox(best, self.preprocessor.input_size)
+
+    def sample(self, roi):
+        # Data sample carrying the ROI geometry the model uses to map
+        # keypoints back to the frame; built once per ROI
+        sample = self.samples.get(roi)
+        if sample is None:
+            from mmengine.structures import InstanceData
+            from mmpose.structures import PoseDataSample
+
+            if len(self.samples) >= ROI_CACHE_SIZE:
+                self.samples.clear()
+            cx, cy, width = roi
+            w, h = self.preprocessor.input_size
+            height = width * h / w
+            sample = PoseDataSample(metainfo={
+                "input_size": (w, h),
+                "input_center": np.array([cx, cy], np.float32),
+                "input_scale": np.array([width, height], np.float32),
+                "flip_indices": self.flip_indices
+            })
+            sample.gt_instances = InstanceData(
+                bboxes=np.array([[cx - width / 2, cy - height / 2,
+                                  cx + width / 2, cy + height / 2]], np.float32),
+                bbox_scores=np.ones(1, np.float32)
+            )
+            self.samples[roi] = sample
+        return sample
+
+    def predict_roi(self, frame):
+        self.roi_age += 1
+        inputs = self.preprocessor(frame, self.roi)
+        if self.device_input is not None:
+            self.device_input.copy_(inputs, non_blocking=True)
+            inputs = self.device_input
+
+        model = self.inferencer.inferencer.model
+        with self.torch.no_grad(), self.autocast():
+            pred = model.predict(inputs, [self.sample(self.roi)])[0].pred_instances
+
+        keypoints = pred.keypoints[0]
+        scores = pred.keypoint_scores[0]
+        # Person left the box: find them again on the next frame
+        if min(float(scores[i]) for i in LOWER_BODY) < KEYPOINT_SCORE_THRESHOLD:
+            self.roi = None
+        return [[{"keypoints": keypoints, "keypoint_scores": scores}]]
+
+
+def create_pose_backend():
+    return PoseBackend(create_pose_inferencer(), inference_precision, use_roi_cache)
+
+
+PRECISION_TOLERANCE_PX = 5.0
+
+
+def clip_lower_body(backend, clip, max_frames):
+    cap = cv2.VideoCapture(clip)
+    if not cap.isOpened():
+        raise OSError(f"cannot open clip: {clip}")
+
+    points = []
+    tracker = KeypointTracker()
+    backend.roi = None
+    while len(points) < max_frames:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        pts, fresh = tracker.update(backend(frame), len(points))
+        points.append(pts if fresh else None)
+    cap.release()
+    return points
+
+
+def check_precision(clip, precision, max_frames=300):
+    # Compares hip/knee keypoints of the reduced-precision model with FP32
+    backend = PoseBackend(create_pose_inferencer(), "fp32", use_roi_cache)
+    reference = clip_lower_body(backend, clip, max_frames)
+
+    backend.set_precision(precision)
+    if backend.precision != precision:
+        return 1
+
+    start = time.perf_counter()
+    candidate = clip_lower_body(backend, clip, max_frames)
+    elapsed = time.perf_counter() - start
+
+    errors = np.array([
+        math.dist(a, b)
+        for ref, cand in zip(reference, candidate)
+        if ref is not None and cand is not None
+        for a, b in zip(ref, cand)
+    ])
+    if not len(errors):
+        print("[precision] no frames with confident hips/knees in both runs")
+        return 1
+
+    mean_err = float(errors.mean())
+    print(f"[precision] {precision} vs fp32 on {clip}")
+    print(f"  frames compared : {len(errors) // len(LOWER_BODY)} / {len(reference)}")
+    print(f"  hip/knee error  : mean {mean_err:.2f}px, "
+          f"p95 {np.percentile(errors, 95):.2f}px, max {errors.max():.2f}px")
+    print(f"  {precision} speed    : {len(candidate) / elapsed:.1f} frames/s")
+    return 0 if mean_err <= PRECISION_TOLERANCE_PX else 1
+
+
+def create_pose_inferencer():
+    cache = ModelCache()
+    manifest = None if rebuild_model_cache else cache.load_manifest()
+
+    if manifest is not None and cache.validate(manifest):
+        inferencer = cache.create_inferencer(manifest)
+        if use_fused_model and "pose2d_fused.pt" not in manifest["files"]:
+            # Fused model requested later: build it from the cached weights
+            cache.build(inferencer, fused=True)
+            cache.apply_fused(inferencer)
+        return inferencer
+
+    # First run (or broken cache): resolve the alias online, then cache it
+    inferencer = MMPoseInferencer("human")
+    try:
+        cache.build(inferencer, fused=use_fused_model)
+        if use_fused_model:
+            cache.apply_fused(inferencer)
+    except Exception as e:
+        print(f"[models] could not write cache: {e}")
+    return inferencer
 
 
 # ============================================================
@@ -76,6 +956,8 @@ selected_difficulty = 1
 # ============================================================
 
 def play_beep():
+    if not sound_enabled:
+        return
     if platform.system() == "Windows":
         import winsound
         winsound.Beep(1000, 150)
@@ -113,6 +995,85 @@ QPushButton:hover {
 """
 
 
+# ============================================================
+# ===================== PRE-RENDERING ========================
+# ============================================================
+
+# Scaled backgrounds and image-button states for the current window size.
+# Filled by the Prerenderer thread so screen switches only swap pixmaps.
+SCALED_BACKGROUNDS = {}   # (path, width, height) -> QPixmap
+BUTTON_STATES = {}        # (path, width) -> (base, hover, pressed) QPixmaps
+
+
+def scale_background(image, size):
+    return image.scaled(
+        size,
+        Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+        Qt.TransformationMode.SmoothTransformation
+    )
+
+
+def background_pixmap(path, pixmap, size):
+    key = (path, size.width(), size.height())
+    pix = SCALED_BACKGROUNDS.get(key)
+    if pix is None:
+        pix = scale_background(pixmap, size)
+        SCALED_BACKGROUNDS[key] = pix
+    return pix
+
+
+def brighten_image(image, factor):
+    img = image.convertToFormat(QImage.Format.Format_ARGB32)
+    for y in range(img.height()):
+        for x in range(img.width()):
+            c = img.pixelColor(x, y)
+            c.setRed(min(255, int(c.red() * factor)))
+            c.setGreen(min(255, int(c.green() * factor)))
+            c.setBlue(min(255, int(c.blue() * factor)))
+            img.setPixelColor(x, y, c)
+    return img
+
+
+def darken_image(image, factor):
+    img = image.convertToFormat(QImage.Format.Format_ARGB32)
+    for y in range(img.height()):
+        for x in range(img.width()):
+            c = img.pixelColor(x, y)
+            c.setRed(int(c.red() * factor))
+            c.setGreen(int(c.green() * factor))
+            c.setBlue(int(c.blue() * factor))
+            img.setPixelColor(x, y, c)
+    return img
+
+
+class Prerenderer(QThread):
+    # Works on QImage only; QPixmaps are created on the GUI thread.
+    rendered = pyqtSignal(object, object, object)
+
+    def __init__(self, size, backgrounds, buttons, parent=None):
+        super().__init__(parent)
+        self.size = size
+        self.backgrounds = backgrounds
+        self.buttons = buttons
+
+    def run(self):
+        backgrounds = {}
+        for path in self.backgrounds:
+            img = QImage(path)
+            if not img.isNull():
+                backgrounds[path] = scale_background(img, self.size)
+
+        buttons = {}
+        for path, width in self.buttons:
+            img = QImage(path)
+            if img.isNull():
+                continue
+            base = img.scaledToWidth(width, Qt.TransformationMode.SmoothTransformation)
+            buttons[(path, width)] = (base, brighten_image(base, 1.08), darken_image(base, 0.9))
+
+        self.rendered.emit(self.size, backgrounds, buttons)
+
+
 # ============================================================
 # ============ FIXED IMAGE BUTTON (NO SIZE BUG) ==============
 # ============================================================
@@ -121,10 +1082,15 @@ class ImageButton(QPushButton):
     def __init__(self, image_path, parent=None):
         super().__init__(parent)
 
+        self.image_path = image_path
+        self.scaled_width = None
         self.original_pixmap = QPixmap(image_path)
         self.base_pixmap = self.original_pixmap
-        self.hover_pixmap = self._brighten(self.original_pixmap, 1.08)
-        self.pressed_pixmap = self._darken(self.original_pixmap, 0.9)
+
+        # Hover/pressed states are built per pixel by the pre-renderer
+        # once the final width is known, to keep startup fast.
+        self.hover_pixmap = self.original_pixmap
+        self.pressed_pixmap = self.original_pixmap
 
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setStyleSheet("border: none; background: transparent;")
@@ -137,13 +1103,23 @@ class ImageButton(QPushButton):
         self.setFixedSize(pix.size())
 
     def set_scaled_width(self, width):
-        self.base_pixmap = self.original_pixmap.scaledToWidth(
-            width, Qt.TransformationMode.SmoothTransformation
-        )
-        self.hover_pixmap = self._brighten(self.base_pixmap, 1.08)
-        self.pressed_pixmap = self._darken(self.base_pixmap, 0.9)
+        self.scaled_width = width
+        states = BUTTON_STATES.get((self.image_path, width))
+        if states is None:
+            # Plain states until the pre-renderer delivers this width
+            base = self.original_pixmap.scaledToWidth(
+                width, Qt.TransformationMode.SmoothTransformation
+            )
+            states = (base, base, base)
+        self.base_pixmap, self.hover_pixmap, self.pressed_pixmap = states
         self._apply_pixmap(self.base_pixmap)
 
+    def refresh_states(self):
+        states = BUTTON_STATES.get((self.image_path, self.scaled_width))
+        if states is not None:
+            self.base_pixmap, self.hover_pixmap, self.pressed_pixmap = states
+            self._apply_pixmap(self.base_pixmap)
+
     def enterEvent(self, event):
         self._apply_pixmap(self.hover_pixmap)
         super().enterEvent(event)
@@ -160,28 +1136,6 @@ class ImageButton(QPushButton):
         self._apply_pixmap(self.hover_pixmap)
         super().mouseReleaseEvent(event)
 
-    def _brighten(self, pix, factor):
-        img = pix.toImage().convertToFormat(QImage.Format.Format_ARGB32)
-        for y in range(img.height()):
-            for x in range(img.width()):
-                c = img.pixelColor(x, y)
-                c.setRed(min(255, int(c.red() * factor)))
-                c.setGreen(min(255, int(c.green() * factor)))
-                c.setBlue(min(255, int(c.blue() * factor)))
-                img.setPixelColor(x, y, c)
-        return QPixmap.fromImage(img)
-
-    def _darken(self, pix, factor):
-        img = pix.toImage().convertToFormat(QImage.Format.Format_ARGB32)
-        for y in range(img.height()):
-            for x in range(img.width()):
-                c = img.pixelColor(x, y)
-                c.setRed(int(c.red() * factor))
-                c.setGreen(int(c.green() * factor))
-                c.setBlue(int(c.blue() * factor))
-                img.setPixelColor(x, y, c)
-        return QPixmap.fromImage(img)
-
 # ============================================================
 # ======================= SPLASH SCREEN ======================
 # ============================================================
@@ -192,7 +1146,8 @@ class SplashScreen(QWidget):
 
         self.bg_label = QLabel(self)
         self.bg_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.bg_pixmap = QPixmap(SPLASH_IMAGE)
+        self.bg_path = SPLASH_IMAGE
+        self.bg_pixmap = QPixmap(self.bg_path)
 
         self.play_btn = ImageButton(PLAY_BUTTON_IMAGE, self)
         self.exit_btn = ImageButton(EXIT_BUTTON_IMAGE, self)
@@ -200,19 +1155,23 @@ class SplashScreen(QWidget):
         self.play_btn.clicked.connect(on_play)
         self.exit_btn.clicked.connect(on_exit)
 
+    @staticmethod
+    def button_width(width):
+        return int(width * 0.18)
+
+    def prerender_buttons(self, size):
+        btn_w = self.button_width(size.width())
+        return [(PLAY_BUTTON_IMAGE, btn_w), (EXIT_BUTTON_IMAGE, btn_w)]
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
 
         if not self.bg_pixmap.isNull():
-            bg = self.bg_pixmap.scaled(
-                self.size(),
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation
-            )
+            bg = background_pixmap(self.bg_path, self.bg_pixmap, self.size())
             self.bg_label.setPixmap(bg)
             self.bg_label.resize(self.size())
 
-        btn_w = int(self.width() * 0.18)
+        btn_w = self.button_width(self.width())
         self.play_btn.set_scaled_width(btn_w)
         self.exit_btn.set_scaled_width(btn_w)
 
@@ -235,7 +1194,8 @@ class InstructionsScreen(QWidget):
 
         self.bg_label = QLabel(self)
         self.bg_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.bg_pixmap = QPixmap(INSTRUCTIONS_IMAGE)
+        self.bg_path = INSTRUCTIONS_IMAGE
+        self.bg_pixmap = QPixmap(self.bg_path)
 
         self.footer = QWidget(self)
         self.footer.setStyleSheet("""
@@ -270,11 +1230,7 @@ class InstructionsScreen(QWidget):
         super().resizeEvent(event)
 
         if not self.bg_pixmap.isNull():
-            bg = self.bg_pixmap.scaled(
-                self.size(),
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation
-            )
+            bg = background_pixmap(self.bg_path, self.bg_pixmap, self.size())
             self.bg_label.setPixmap(bg)
             self.bg_label.resize(self.size())
 
@@ -350,7 +1306,8 @@ class PostureScreen(QWidget):
         super().__init__()
 
         self.bg = QLabel(self)
-        self.bg_pixmap = QPixmap(BACKGROUND_IMAGE)
+        self.bg_path = BACKGROUND_IMAGE
+        self.bg_pixmap = QPixmap(self.bg_path)
         self.bg.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         self.title = create_title(self, "SELECT POSTURE")
@@ -383,13 +1340,7 @@ class PostureScreen(QWidget):
             self.standing_btn.setStyleSheet(GLOW_UNSELECTED_STYLE)
 
     def resizeEvent(self, e):
-        self.bg.setPixmap(
-            self.bg_pixmap.scaled(
-                self.size(),
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation
-            )
-        )
+        self.bg.setPixmap(background_pixmap(self.bg_path, self.bg_pixmap, self.size()))
         self.bg.resize(self.size())
 
         self.title.setGeometry(
@@ -414,7 +1365,8 @@ class DifficultyScreen(QWidget):
         super().__init__()
 
         self.bg = QLabel(self)
-        self.bg_pixmap = QPixmap(BACKGROUND_IMAGE)
+        self.bg_path = BACKGROUND_IMAGE
+        self.bg_pixmap = QPixmap(self.bg_path)
         self.bg.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         self.title = create_title(self, "SELECT DIFFICULTY")
@@ -446,13 +1398,7 @@ class DifficultyScreen(QWidget):
                 btn.setStyleSheet(GLOW_UNSELECTED_STYLE)
 
     def resizeEvent(self, e):
-        self.bg.setPixmap(
-            self.bg_pixmap.scaled(
-                self.size(),
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation
-            )
-        )
+        self.bg.setPixmap(background_pixmap(self.bg_path, self.bg_pixmap, self.size()))
         self.bg.resize(self.size())
 
         self.title.setGeometry(
@@ -477,7 +1423,8 @@ class TimeSelectScreen(QWidget):
         super().__init__()
 
         self.bg = QLabel(self)
-        self.bg_pixmap = QPixmap(BACKGROUND_IMAGE)
+        self.bg_path = BACKGROUND_IMAGE
+        self.bg_pixmap = QPixmap(self.bg_path)
         self.bg.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         self.title = create_title(self, "SELECT TIME")
@@ -510,26 +1457,25 @@ class TimeSelectScreen(QWidget):
         self.update_label()
 
     def decrease(self):
-        global SESSION_TIME_SECONDS
-        SESSION_TIME_SECONDS = max(10, SESSION_TIME_SECONDS - 5)
+        global selected_session_seconds
+        lo, hi, step = RULES.session_limits()
+        selected_session_seconds = max(lo, selected_session_seconds - step)
         self.update_label()
 
     def increase(self):
-        global SESSION_TIME_SECONDS
-        SESSION_TIME_SECONDS = min(120, SESSION_TIME_SECONDS + 5)
+        global selected_session_seconds
+        lo, hi, step = RULES.session_limits()
+        selected_session_seconds = min(hi, selected_session_seconds + step)
         self.update_label()
 
     def update_label(self):
-        self.time_label.setText(f"{SESSION_TIME_SECONDS} s")
+        global selected_session_seconds
+        lo, hi, step = RULES.session_limits()
+        selected_session_seconds = min(hi, max(lo, selected_session_seconds))
+        self.time_label.setText(f"{selected_session_seconds} s")
 
     def resizeEvent(self, e):
-        self.bg.setPixmap(
-            self.bg_pixmap.scaled(
-                self.size(),
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation
-            )
-        )
+        self.bg.setPixmap(background_pixmap(self.bg_path, self.bg_pixmap, self.size()))
         self.bg.resize(self.size())
 
         self.title.setGeometry(
@@ -553,19 +1499,831 @@ class TimeSelectScreen(QWidget):
         self.next_btn.move(self.width() // 2 + 20, nav_y)
 
 
+# ============================================================
+# ==================== BODY CALIBRATION ======================
+# ============================================================
+
+CALIBRATION_SECONDS = 3.0
+CALIBRATION_MIN_SAMPLES = 15
+DEFAULT_BODY_UNIT = 60.0   # hip width in pixels, used until calibrated
+THIGH_HIP_RATIO = 1.6      # typical standing thigh length in hip widths
+MIN_HIP_FRACTION = 0.6     # hip width below this share of the thigh estimate is unreliable
+
+
+class BodyCalibrator:
+    # Ring buffer of per-frame (hip width, thigh length) measurements;
+    # the median keeps single bad detections from skewing the scale.
+    def __init__(self, size=128):
+        self.samples = np.zeros((size, 2), dtype=np.float32)
+        self.count = 0
+        self.index = 0
+
+    def reset(self):
+        self.count = 0
+        self.index = 0
+
+    def add(self, left_hip, right_hip, left_knee, right_knee):
+        hip_width = math.dist(left_hip, right_hip)
+        if hip_width < 1.0:
+            return
+        thigh = (math.dist(left_hip, left_knee) + math.dist(right_hip, right_knee)) / 2
+
+        self.samples[self.index] = (hip_width, thigh)
+        self.index = (self.index + 1) % len(self.samples)
+        self.count = min(self.count + 1, len(self.samples))
+
+    def estimate(self, posture="standing"):
+        hip_width, thigh = (float(v) for v in np.median(self.samples[:self.count], axis=0))
+        # A patient turned away from the camera shows a narrow hip; when
+        # standing, the thigh (seen side-on or front-on) gives the scale.
+        # Seated thighs point at the camera, so they are not used there.
+        if posture == "standing" and hip_width < MIN_HIP_FRACTION * thigh / THIGH_HIP_RATIO:
+            print(f"[calibration] hip width {hip_width:.0f}px looks foreshortened, "
+                  f"using thigh length {thigh:.0f}px")
+            hip_width = thigh / THIGH_HIP_RATIO
+        return {"hip_width": hip_width, "thigh_length": thigh}
+
+
+def calibration_path(profile_name):
+    # Only named profiles keep a calibration; on the default profile
+    # each session is a potentially different patient.
+    if profile_name is None:
+        return None
+    return os.path.join(CALIBRATION_DIR, profile_name + ".json")
+
+
+def load_calibration(profile_name):
+    path = calibration_path(profile_name)
+    if path is None:
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            scale = json.load(f)
+        if float(scale["hip_width"]) > 1.0:
+            return scale
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def save_calibration(profile_name, scale):
+    path = calibration_path(profile_name)
+    if path is None:
+        return
+    try:
+        os.makedirs(CALIBRATION_DIR, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(scale, f, indent=2)
+    except OSError as e:
+        print(f"[calibration] could not save: {e}")
+
+
+# ============================================================
+# ================= SESSION STATISTICS =======================
+# ============================================================
+
+class P2Quantile:
+    # P-square streaming quantile estimate (Jain & Chlamtac):
+    # five markers, constant memory, O(1) per sample.
+    def __init__(self, p):
+        self.p = p
+        self.n = 0
+        self.q = []
+        self.pos = [1, 2, 3, 4, 5]
+        self.desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self.inc = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, x):
+        self.n += 1
+        if self.n <= 5:
+            self.q.append(x)
+            self.q.sort()
+            return
+
+        q, pos = self.q, self.pos
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            pos[i] += 1
+        for i in range(5):
+            self.desired[i] += self.inc[i]
+
+        for i in (1, 2, 3):
+            d = self.desired[i] - pos[i]
+            if (d >= 1 and pos[i + 1] - pos[i] > 1) or (d <= -1 and pos[i - 1] - pos[i] < -1):
+                d = 1 if d > 0 else -1
+                qp = q[i] + d / (pos[i + 1] - pos[i - 1]) * (
+                    (pos[i] - pos[i - 1] + d) * (q[i + 1] - q[i]) / (pos[i + 1] - pos[i]) +
+                    (pos[i + 1] - pos[i] - d) * (q[i] - q[i - 1]) / (pos[i] - pos[i - 1])
+                )
+                if not q[i - 1] < qp < q[i + 1]:
+                    qp = q[i] + d * (q[i + d] - q[i]) / (pos[i + d] - pos[i])
+                q[i] = qp
+                pos[i] += d
+
+    def value(self):
+        if self.n == 0:
+            return 0.0
+        if self.n <= 5:
+            return self.q[round(self.p * (self.n - 1))]
+        return self.q[2]
+
+
+class SessionStats:
+    # Online kick-time statistics, updated once per kick.
+    # Welford mean/variance plus min/max and P2 percentiles.
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = 0.0
+        self.max = 0.0
+        self.median = P2Quantile(0.5)
+        self.p90 = P2Quantile(0.9)
+
+    def add(self, x):
+        self.count += 1
+        if self.count == 1:
+            self.min = self.max = x
+        else:
+            self.min = min(self.min, x)
+            self.max = max(self.max, x)
+
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+        self.median.add(x)
+        self.p90.add(x)
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self):
+        return math.sqrt(self.variance)
+
+
+# ============================================================
+# ================= SESSION ANALYTICS ========================
+# ============================================================
+
+MAX_SESSION_SECONDS = 120
+TRAJECTORY_MAX_FPS = 60
+SMOOTHING_WINDOW = 5
+
+# Trajectory columns
+T_COL, HIP_X, HIP_Y, LK_X, LK_Y, RK_X, RK_Y, HOLD_COL = range(8)
+
+
+class TrajectoryBuffer:
+    # Preallocated per-frame hip/knee samples, reused across sessions.
+    # HOLD_COL is 0 when no ball is held, 1 for left knee, 2 for right knee.
+    def __init__(self, seconds=MAX_SESSION_SECONDS):
+        self.data = np.zeros((seconds * TRAJECTORY_MAX_FPS, 8), dtype=np.float32)
+        self.count = 0
+
+    def reset(self, seconds=None):
+        # Grows (never shrinks) when a profile allows longer sessions
+        if seconds is not None and seconds * TRAJECTORY_MAX_FPS > len(self.data):
+            self.data = np.zeros((seconds * TRAJECTORY_MAX_FPS, 8), dtype=np.float32)
+        self.count = 0
+
+    def append(self, t, hip, left_knee, right_knee, hold):
+        if self.count >= len(self.data):
+            return
+        self.data[self.count] = (
+            t, hip[0], hip[1],
+            left_knee[0], left_knee[1],
+            right_knee[0], right_knee[1],
+            hold
+        )
+        self.count += 1
+
+    def samples(self):
+        return self.data[:self.count]
+
+
+def rolling_mean(values, window):
+    if len(values) < window:
+        return values
+    windows = np.lib.stride_tricks.sliding_window_view(values, window, axis=0)
+    smoothed = windows.mean(axis=-1)
+    pad = window // 2
+    return np.concatenate(
+        [np.repeat(smoothed[:1], pad, axis=0), smoothed,
+         np.repeat(smoothed[-1:], window - 1 - pad, axis=0)]
+    )
+
+
+def compute_kinematics(samples, hold_time, unit):
+    # Single vectorized pass over the session trajectory.
+    # Lengths are reported in body units (hip widths).
+    if len(samples) < SMOOTHING_WINDOW:
+        return None
+
+    t = samples[:, T_COL].astype(np.float64)
+    hip_y = samples[:, HIP_Y]
+    knees = rolling_mean(samples[:, LK_X:RK_Y + 1].astype(np.float64), SMOOTHING_WINDOW)
+
+    # Knee height above hip (image y grows downwards); lift is the rise
+    # from the resting (5th percentile) height to the peak.
+    height = hip_y[:, None] - knees[:, [1, 3]]
+    lift = height.max(axis=0) - np.percentile(height, 5, axis=0)
+
+    # Peak knee speed from finite differences; np.gradient needs strictly
+    # increasing sample times, so repeated or out-of-order ones are dropped
+    increasing = np.ones(len(t), dtype=bool)
+    increasing[1:] = t[1:] > np.maximum.accumulate(t)[:-1]
+    if increasing.sum() > 1:
+        vel = np.gradient(knees[increasing], t[increasing], axis=0)
+        speed = np.hypot(vel[:, [0, 2]], vel[:, [1, 3]])
+        peak_speed = speed.max(axis=0)
+    else:
+        peak_speed = np.zeros(2)
+
+    symmetry = 100.0 * lift.min() / lift.max() if lift.max() > 0 else 100.0
+
+    # Hold stability: positional spread of the raw (unsmoothed) holding knee
+    # over the last HOLD_TIME of each held segment, weighted by frames, so
+    # the approach into the ball never counts as sway.
+    hold = samples[increasing, HOLD_COL].astype(np.int8)
+    sway = 0.0
+    if hold.any() and len(hold) > 1:
+        raw = samples[increasing, LK_X:RK_Y + 1].astype(np.float64)
+        frame_dt = max(float(np.median(np.diff(t[increasing]))), 1e-3)
+        window = max(2, int(round(hold_time / frame_dt)))
+        total = frames = 0.0
+        bounds = np.flatnonzero(np.diff(hold)) + 1
+        for segment in np.split(np.arange(len(hold)), bounds):
+            side = int(hold[segment[0]])
+            if side == 0 or len(segment) < 2:
+                continue
+            knee = raw[segment[-window:], 2 * side - 2:2 * side]
+            total += len(knee) * float(np.hypot(*knee.std(axis=0)))
+            frames += len(knee)
+        if frames:
+            sway = total / frames
+
+    return {
+        "lift_left": float(lift[0]) / unit,
+        "lift_right": float(lift[1]) / unit,
+        "peak_speed_left": float(peak_speed[0]) / unit,
+        "peak_speed_right": float(peak_speed[1]) / unit,
+        "symmetry": float(symmetry),
+        "hold_sway": sway / unit
+    }
+
+
+# ============================================================
+# ==================== SESSION RECORDING =====================
+# ============================================================
+
+RECORD_BASE_FPS = 30
+RECORDER_SLOTS = 8
+RECORDING_CODECS = {"mp4v": ".mp4", "avc1": ".mp4", "MJPG": ".avi", "XVID": ".avi"}
+
+
+class SessionRecorder:
+    # Encodes composited game frames on a background thread.
+    # Frames are resized straight into a fixed pool of slot buffers and
+    # only slot indices cross the queue; when every slot is still waiting
+    # for the encoder the frame is left out of the recording, never
+    # from the game, and the next accepted frame is repeated in its place.
+    # Frames are placed on a constant-rate timeline by capture time
+    # (repeated or skipped), so playback runs in real time whatever the
+    # game's tick rate.
+    def __init__(self, codec="mp4v", size=None, frame_skip=1):
+        self.codec = codec
+        self.size = size
+        self.frame_skip = max(1, frame_skip)
+
+        self.slots = None
+        self.free = queue.Queue()
+        self.ready = queue.Queue()
+        self.thread = None
+
+        self.fps = RECORD_BASE_FPS / self.frame_skip
+        self.next_due = None
+        self.written = 0
+        self.carry = 0
+        self.duplicated = 0
+        self.failed = False
+
+    def start(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.next_due = None
+        self.written = 0
+        self.carry = 0
+        self.duplicated = 0
+        self.failed = False
+        self.thread = threading.Thread(target=self._encode, name="recorder", daemon=True)
+        self.thread.start()
+
+    def submit(self, frame, t):
+        # Number of output frames this frame covers up to capture time t
+        if self.next_due is None:
+            self.next_due = t
+        repeats = 0
+        while self.next_due <= t:
+            self.next_due += 1.0 / self.fps
+            repeats += 1
+        if not repeats or self.failed:
+            return
+
+        if self.slots is None:
+            w, h = self.size or (frame.shape[1], frame.shape[0])
+            self.slots = [np.empty((h, w, 3), dtype=np.uint8) for _ in range(RECORDER_SLOTS)]
+            for i in range(RECORDER_SLOTS):
+                self.free.put_nowait(i)
+
+        try:
+            idx = self.free.get_nowait()
+        except queue.Empty:
+            # Keep the timeline: the next accepted frame covers these too
+            self.carry += repeats
+            self.duplicated += repeats
+            return
+
+        slot = self.slots[idx]
+        if slot.shape == frame.shape:
+            np.copyto(slot, frame)
+        else:
+            cv2.resize(frame, (slot.shape[1], slot.shape[0]), dst=slot,
+                       interpolation=cv2.INTER_AREA)
+        self.ready.put_nowait((idx, repeats + self.carry))
+        self.carry = 0
+
+    @property
+    def recording(self):
+        return self.thread is not None
+
+    def stop(self):
+        if self.thread is None:
+            return
+        # Frames still owed at the end repeat the last one written
+        self.ready.put((None, self.carry))
+        self.carry = 0
+        self.thread.join()
+        self.thread = None
+        if self.failed:
+            print(f"[recording] could not open a {self.codec} writer for {self.path}")
+            return
+        print(f"[recording] {self.path}: {self.written} frames written "
+              f"({self.written / self.fps:.1f}s at {self.fps:g} fps), "
+              f"{self.duplicated} duplicated while the encoder caught up")
+
+    def _open_writer(self, w, h):
+        fourcc = cv2.VideoWriter_fourcc(*self.codec)
+        fps = self.fps
+
+        # Ask for a hardware encoder where the OpenCV build supports it
+        hw = getattr(cv2, "VIDEOWRITER_PROP_HW_ACCELERATION", None)
+        if hw is not None:
+            writer = cv2.VideoWriter(
+                self.path, cv2.CAP_ANY, fourcc, fps, (w, h),
+                [hw, cv2.VIDEO_ACCELERATION_ANY]
+            )
+            if writer.isOpened():
+                return writer
+        return cv2.VideoWriter(self.path, fourcc, fps, (w, h))
+
+    def _encode(self):
+        # The last written slot is held back so owed frames can repeat it
+        writer = None
+        last = None
+        while True:
+            idx, repeats = self.ready.get()
+            if idx is None:
+                if writer is not None and last is not None:
+                    for _ in range(repeats):
+                        writer.write(self.slots[last])
+                    self.written += repeats
+                break
+
+            slot = self.slots[idx]
+            if writer is None and not self.failed:
+                writer = self._open_writer(slot.shape[1], slot.shape[0])
+                if not writer.isOpened():
+                    writer = None
+                    self.failed = True
+            if writer is not None:
+                for _ in range(repeats):
+                    writer.write(slot)
+                self.written += repeats
+            if last is not None:
+                self.free.put_nowait(last)
+            last = idx
+
+        if writer is not None:
+            writer.release()
+
+
+def recording_path(profile_name, codec):
+    stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+    return os.path.join(RECORDING_DIR, f"{profile_name}_{stamp}{RECORDING_CODECS[codec]}")
+
+
+# ============================================================
+# ==================== REMOTE MONITORING =====================
+# ============================================================
+
+MONITOR_TICK_HZ = 15
+MONITOR_CLIENT_BUFFER = 8
+MONITOR_PREVIEW_WIDTH = 320
+MONITOR_PREVIEW_FPS = 5
+MONITOR_IDLE_SECONDS = 5.0     # resend the last preview frame this often when idle
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+# asyncio is only needed with --monitor, so it stays off the splash path
+# and is imported when the server starts.
+asyncio = None
+
+MONITOR_PAGE = """<!doctype html>
+<html><head><title>KickSitStand - {name}</title></head>
+<body style="background:#020617;color:#e0f2fe;font-family:sans-serif">
+<h2>{name}</h2>
+<img src="/preview.mjpg" style="width:480px;border-radius:12px"><br>
+<pre id="tick"></pre><pre id="score"></pre>
+<script>
+const ws = new WebSocket("ws://" + location.host + "/ws");
+ws.onmessage = e => {{
+  const m = JSON.parse(e.data);
+  document.getElementById(m.type == "scorecard" ? "score" : "tick").textContent =
+    JSON.stringify(m, null, 2);
+}};
+</script></body></html>
+"""
+
+
+def websocket_frame(text):
+    payload = text.encode("utf-8")
+    n = len(payload)
+    if n < 126:
+        header = bytes((0x81, n))
+    elif n < 65536:
+        header = bytes((0x81, 126)) + n.to_bytes(2, "big")
+    else:
+        header = bytes((0x81, 127)) + n.to_bytes(8, "big")
+    return header + payload
+
+
+class MonitorServer:
+    # Local HTTP/WebSocket server on its own asyncio thread.
+    # The game only posts messages with call_soon_threadsafe; each client
+    # has a small bounded queue and loses its oldest messages when it falls
+    # behind, so a slow client can never stall game_tick.
+    def __init__(self, host="127.0.0.1", port=8765, name=None):
+        self.host = host
+        self.port = port
+        self.name = name or platform.node()
+
+        self.loop = None
+        self.thread = None
+        self.clients = set()
+
+        self.last_tick = None
+        self.last_scorecard = None
+        self.next_tick = 0.0
+
+        self.preview_due = 0.0
+        self.preview_jpeg = None
+        self.preview_version = 0
+        self.preview_event = None
+
+    # ---------- GUI THREAD ----------
+    def start(self):
+        global asyncio
+        import asyncio as _asyncio
+        asyncio = _asyncio
+
+        started = threading.Event()
+        self.thread = threading.Thread(target=self._run, args=(started,),
+                                       name="monitor", daemon=True)
+        self.thread.start()
+        started.wait()
+        if self.loop is None:
+            self.thread.join()
+            return False
+        return True
+
+    def stop(self):
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join()
+
+    def publish_tick(self, data, now):
+        if now < self.next_tick:
+            return
+        self.next_tick = now + 1.0 / MONITOR_TICK_HZ
+        self._post("tick", data)
+
+    def publish_scorecard(self, data):
+        self._post("scorecard", data)
+
+    def offer_frame(self, frame, now):
+        if now < self.preview_due:
+            return
+        self.preview_due = now + 1.0 / MONITOR_PREVIEW_FPS
+
+        h, w = frame.shape[:2]
+        size = (MONITOR_PREVIEW_WIDTH, max(1, h * MONITOR_PREVIEW_WIDTH // w))
+        small = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+        self.loop.call_soon_threadsafe(self._encode_preview, small)
+
+    def _post(self, kind, data):
+        message = {"type": kind, "station": self.name}
+        message.update(data)
+        self.loop.call_soon_threadsafe(self._fanout, message)
+
+    # ---------- MONITOR THREAD ----------
+    def _run(self, started):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self.preview_event = asyncio.Event()
+        server = None
+        try:
+            server = loop.run_until_complete(
+                asyncio.start_server(self._handle, self.host, self.port)
+            )
+        except Exception as e:
+            print(f"[monitor] cannot listen on {self.host}:{self.port}: {e}")
+        finally:
+            # self.loop is only published once the server is listening
+            if server is not None:
+                self.loop = loop
+            started.set()
+        if server is None:
+            loop.close()
+            return
+
+        print(f"[monitor] http://{self.host}:{self.port}/")
+        try:
+            self.loop.run_forever()
+        finally:
+            server.close()
+            tasks = asyncio.all_tasks(self.loop)
+            for task in tasks:
+                task.cancel()
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self.loop.close()
+
+    def _fanout(self, message):
+        if message["type"] == "tick":
+            self.last_tick = message
+        else:
+            self.last_scorecard = message
+
+        text = json.dumps(message)
+        for q in self.clients:
+            if q.full():
+                q.get_nowait()   # drop the oldest, keep the stream live
+            q.put_nowait(text)
+
+    def _encode_preview(self, small):
+        ok, jpeg = cv2.imencode(".jpg", small, [cv2.IMWRITE_JPEG_QUALITY, 70])
+        if ok:
+            self.preview_jpeg = jpeg.tobytes()
+            self.preview_version += 1
+            self.preview_event.set()
+            self.preview_event = asyncio.Event()
+
+    async def _handle(self, reader, writer):
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+            lines = head.decode("latin-1").split("\r\n")
+            method, path = lines[0].split(" ")[:2]
+            headers = {}
+            for line in lines[1:]:
+                if ":" in line:
+                    k, v = line.split(":", 1)
+                    headers[k.strip().lower()] = v.strip()
+
+            if method != "GET":
+                await self._respond(writer, "405 Method Not Allowed", "text/plain", b"")
+            elif path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+                await self._websocket(reader, writer, headers)
+            elif path == "/status":
+                body = json.dumps({
+                    "station": self.name,
+                    "tick": self.last_tick,
+                    "scorecard": self.last_scorecard
+                }).encode("utf-8")
+                await self._respond(writer, "200 OK", "application/json", body)
+            elif path == "/preview.jpg" and self.preview_jpeg is not None:
+                await self._respond(writer, "200 OK", "image/jpeg", self.preview_jpeg)
+            elif path == "/preview.mjpg":
+                await self._mjpeg(reader, writer)
+            elif path == "/":
+                page = MONITOR_PAGE.format(name=self.name).encode("utf-8")
+                await self._respond(writer, "200 OK", "text/html", page)
+            else:
+                await self._respond(writer, "404 Not Found", "text/plain", b"")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                asyncio.CancelledError, ConnectionError, ValueError):
+            # Cancellation only happens at shutdown; end the handler quietly
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, status, content_type, body):
+        writer.write(
+            f"HTTP/1.1 {status}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n".encode("latin-1") + body
+        )
+        await writer.drain()
+
+    async def _websocket(self, reader, writer, headers):
+        key = headers.get("sec-websocket-key")
+        if not key:
+            await self._respond(writer, "400 Bad Request", "text/plain", b"missing Sec-WebSocket-Key")
+            return
+        accept = base64.b64encode(
+            hashlib.sha1((key + WEBSOCKET_GUID).encode("latin-1")).digest()
+        ).decode("latin-1")
+        writer.write(
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept}\r\n\r\n".encode("latin-1")
+        )
+
+        q = asyncio.Queue(MONITOR_CLIENT_BUFFER)
+        for message in (self.last_tick, self.last_scorecard):
+            if message is not None:
+                q.put_nowait(json.dumps(message))
+        self.clients.add(q)
+
+        # Client frames are only read to notice a close or disconnect
+        closed = asyncio.ensure_future(reader.read(65536))
+        try:
+            while True:
+                send = asyncio.ensure_future(q.get())
+                done, _ = await asyncio.wait(
+                    {send, closed}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if closed in done:
+                    data = closed.result()
+                    if not data or data[0] & 0x0F == 0x8:
+                        send.cancel()
+                        break
+                    closed = asyncio.ensure_future(reader.read(65536))
+                if send in done:
+                    writer.write(websocket_frame(send.result()))
+                    await writer.drain()
+                else:
+                    send.cancel()
+        finally:
+            self.clients.discard(q)
+            closed.cancel()
+
+    async def _mjpeg(self, reader, writer):
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: multipart/x-mixed-replace; boundary=frame\r\n"
+            b"Cache-Control: no-cache\r\n\r\n"
+        )
+        # The client sends nothing more; a read completing means it left
+        closed = asyncio.ensure_future(reader.read(1024))
+        try:
+            await self._stream_preview(writer, closed)
+        finally:
+            closed.cancel()
+
+    async def _stream_preview(self, writer, closed):
+        sent = -1
+        while not closed.done():
+            if self.preview_version == sent or self.preview_jpeg is None:
+                frame = asyncio.ensure_future(self.preview_event.wait())
+                done, _ = await asyncio.wait(
+                    {frame, closed}, timeout=MONITOR_IDLE_SECONDS,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                frame.cancel()
+                if done or self.preview_jpeg is None:
+                    continue
+                # No new frames (e.g. between sessions): resend the last
+                # one so a vanished client shows up as a failed write
+            sent = self.preview_version
+            jpeg = self.preview_jpeg
+            writer.write(
+                b"--frame\r\nContent-Type: image/jpeg\r\n"
+                + f"Content-Length: {len(jpeg)}\r\n\r\n".encode("latin-1")
+                + jpeg + b"\r\n"
+            )
+            # Waiting here only delays this client; newer frames replace
+            # the one it missed.
+            await writer.drain()
+
+
+# ============================================================
+# ==================== MEMORY ACCOUNTING =====================
+# ============================================================
+
+MEMORY_SAMPLE_TICKS = 60
+SPRITE_CACHE_SIZE = 8
+
+
+class FrameBuffers:
+    # Named per-tick buffers, reallocated only when the frame shape changes
+    def __init__(self):
+        self.buffers = {}
+
+    def get(self, name, shape, dtype=None):
+        dtype = np.uint8 if dtype is None else dtype
+        buf = self.buffers.get(name)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = np.empty(shape, dtype=dtype)
+            self.buffers[name] = buf
+        return buf
+
+
+class AllocationMonitor:
+    # Samples every N-th tick with tracemalloc: the traced peak above the
+    # tick's starting level is the memory that tick allocated.
+    def __init__(self, every=MEMORY_SAMPLE_TICKS):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.every = every
+        self.ticks = 0
+        self.sampling = False
+        self.reset()
+
+    def reset(self):
+        self.samples = 0
+        self.total_bytes = 0
+        self.max_bytes = 0
+
+    def before_tick(self):
+        self.ticks += 1
+        self.sampling = self.ticks % self.every == 0
+        if self.sampling:
+            tracemalloc.reset_peak()
+            self.base = tracemalloc.get_traced_memory()[0]
+
+    def after_tick(self):
+        if self.sampling:
+            peak = tracemalloc.get_traced_memory()[1]
+            allocated = peak - self.base
+            self.samples += 1
+            self.total_bytes += allocated
+            self.max_bytes = max(self.max_bytes, allocated)
+
+    def summary(self):
+        return {
+            "sampled_ticks": self.samples,
+            "avg_tick_bytes": self.total_bytes // self.samples if self.samples else 0,
+            "max_tick_bytes": self.max_bytes,
+            "traced_bytes": tracemalloc.get_traced_memory()[0]
+        }
+
+
+_psutil_process = None
+
+
+def current_rss():
+    global _psutil_process
+    if _psutil_process is None:
+        try:
+            import psutil
+            _psutil_process = psutil.Process()
+        except ImportError:
+            _psutil_process = False
+    if _psutil_process:
+        return _psutil_process.memory_info().rss
+
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
 # ============================================================
 # ================= GAME STATE HELPERS =======================
 # ============================================================
 
-def reset_game_state():
+def reset_game_state(now):
     return {
-        "BALL_SIDES": ["left", "right"],
-        "current_side_index": 0,
-        "level": 1,
+        "pattern_index": 0,
+        "level": 0,
         "total_kicks": 0,
-        "kick_times": [],
-        "ball_spawn_time": time.time(),
-        "last_kick_time": time.time() - 10,
+        "kick_stats": SessionStats(),
+        "ball_spawn_time": now,
+        "last_kick_time": now - 10,
         "in_ball": False,
         "in_ball_since": 0.0,
         "must_leave_ball": False,
@@ -573,30 +2331,328 @@ def reset_game_state():
     }
 
 
+def session_summary(game_state, duration):
+    stats = game_state["kick_stats"]
+    return {
+        "kicks": game_state["total_kicks"],
+        "duration": int(duration),
+        "avg_kick_time": round(stats.mean, 3),
+        "best_kick_time": round(stats.min, 3),
+        "median_kick_time": round(stats.median.value(), 3),
+        "p90_kick_time": round(stats.p90.value(), 3),
+        "kick_time_sd": round(stats.stddev, 3),
+        "kinematics": game_state.get("kinematics"),
+        "frame_timing": game_state.get("frame_timing")
+    }
+
+
 def unpack_xy(kpt):
     if len(kpt) >= 2:
         return float(kpt[0]), float(kpt[1])
     return 0.0, 0.0
 
 
+# ============================================================
+# ==================== KEYPOINT QUALITY ======================
+# ============================================================
+
+KEYPOINT_SCORE_THRESHOLD = 0.3
+KEYPOINT_TTL = 0.3           # seconds a good estimate may be reused
+LOWER_BODY = (11, 12, 13, 14)   # left hip, right hip, left knee, right knee
+
+
+class KeypointTracker:
+    # Keeps the last confident hip/knee estimate. update() returns
+    # (points, fresh): fresh points may be hit-tested, held ones may
+    # only be drawn, and None means tracking is lost.
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.points = None
+        self.last_good = -math.inf
+
+    def update(self, preds, now):
+        best = None
+        best_score = KEYPOINT_SCORE_THRESHOLD
+        for inst in (preds[0] if preds else ()):
+            keypoints = inst.get("keypoints", ())
+            scores = inst.get("keypoint_scores")
+            if len(keypoints) < 15 or scores is None or len(scores) < 15:
+                continue
+            score = min(float(scores[i]) for i in LOWER_BODY)
+            if score >= best_score:
+                best = keypoints
+                best_score = score
+
+        if best is None:
+            return self.held(now)
+
+        self.points = tuple(unpack_xy(best[i]) for i in LOWER_BODY)
+        self.last_good = now
+        return self.points, True
+
+    def held(self, now):
+        if self.points is not None and now - self.last_good <= KEYPOINT_TTL:
+            return self.points, False
+        return None, False
+
+
+class InferenceScheduler:
+    # Runs pose inference every tick while tracking is poor and backs
+    # off to every max_stride-th tick once it has been stable.
+    def __init__(self, max_stride=2, settle_ticks=30):
+        self.max_stride = max_stride
+        self.settle_ticks = settle_ticks
+        self.reset()
+
+    def reset(self):
+        self.stride = 1
+        self.countdown = 0
+        self.good_streak = 0
+
+    def should_infer(self):
+        if self.countdown > 0:
+            self.countdown -= 1
+            return False
+        self.countdown = self.stride - 1
+        return True
+
+    def report(self, tracking_ok):
+        if tracking_ok:
+            self.good_streak += 1
+            if self.good_streak >= self.settle_ticks:
+                self.stride = self.max_stride
+        else:
+            self.good_streak = 0
+            self.stride = 1
+            self.countdown = 0
+
+
+# ============================================================
+# ======================= KICK LOGIC =========================
+# ============================================================
+
+def split_points(points):
+    # Hip centre and (left, right) knees, identified by X position
+    (lx, ly), (rx, ry), (k0x, k0y), (k1x, k1y) = points
+    hip = ((lx + rx) / 2, (ly + ry) / 2)
+    if k0x <= k1x:
+        return hip, (int(k0x), int(k0y)), (int(k1x), int(k1y))
+    return hip, (int(k1x), int(k1y)), (int(k0x), int(k0y))
+
+
+def judge_kick(game_state, rules, hip_x, hip_y, left_knee, right_knee, fresh, now):
+    # One frame of the hit logic, kept free of camera and drawing so the
+    # simulator can drive it. Returns the ball centre and whether a kick
+    # was scored on this frame.
+    side = rules.sides[game_state["pattern_index"]]
+    if side == SIDE_LEFT:
+        knee_x, knee_y = left_knee
+        ball_x = hip_x - rules.offset
+    else:
+        knee_x, knee_y = right_knee
+        ball_x = hip_x + rules.offset
+    ball_y = hip_y - rules.heights[game_state["level"]]
+
+    dx = knee_x - ball_x
+    dy = knee_y - ball_y
+    inside = dx * dx + dy * dy <= rules.hit_radius_sq
+
+    # Held (stale) estimates are drawn but never hit-tested
+    if not fresh:
+        return ball_x, ball_y, False
+
+    if not inside:
+        game_state["in_ball"] = False
+        game_state["must_leave_ball"] = False
+        return ball_x, ball_y, False
+
+    if not game_state["in_ball"]:
+        game_state["in_ball"] = True
+        game_state["in_ball_since"] = now
+        return ball_x, ball_y, False
+
+    if (
+        game_state["must_leave_ball"]
+        or (now - game_state["in_ball_since"]) < rules.hold_time
+        or (now - game_state["last_kick_time"]) < rules.min_kick_interval
+    ):
+        return ball_x, ball_y, False
+
+    game_state["kick_stats"].add(now - game_state["ball_spawn_time"])
+    game_state["total_kicks"] += 1
+
+    game_state["last_hit_time"] = now
+    game_state["last_kick_time"] = now
+    game_state["ball_spawn_time"] = now
+    game_state["must_leave_ball"] = True
+    game_state["in_ball"] = False
+    game_state["pattern_index"] = (game_state["pattern_index"] + 1) % len(rules.sides)
+
+    if rules.kicks_per_step and game_state["total_kicks"] % rules.kicks_per_step == 0:
+        game_state["level"] = min(game_state["level"] + 1, len(rules.heights) - 1)
+
+    return ball_x, ball_y, True
+
+
+# ============================================================
+# ==================== FRAME SCHEDULING ======================
+# ============================================================
+
+FRAME_SLOTS = 3
+COUNTDOWN_INTERVAL_MS = 250
+CAMERA_RETRY_SECONDS = 0.01
+
+
+class FrameSource(QThread):
+    # Pipeline thread: reads the camera, then runs analyze(raw, now, dst)
+    # (flip + pose) into a small ring of reused frame buffers and signals
+    # the GUI when a result is ready. The GUI thread only scores and
+    # draws. Only the newest result is kept: if the GUI has not taken the
+    # previous one yet it is replaced and no second signal is queued.
+    frame_ready = pyqtSignal()
+
+    def __init__(self, camera, analyze, clock=time.perf_counter, parent=None):
+        super().__init__(parent)
+        self.cap = camera
+        self.analyze = analyze
+        self.clock = clock
+        self.raw = None
+        self.slots = [None] * FRAME_SLOTS
+        self.results = [None] * FRAME_SLOTS
+        self.lock = threading.Lock()
+        self.running = False
+        self.reset()
+
+    def reset(self):
+        self.latest = None      # slot holding the newest untaken result
+        self.in_use = None      # slot the GUI is drawing on
+        self.signalled = False
+        self.coalesced = 0
+
+    def start(self):
+        self.reset()
+        self.running = True
+        super().start()
+
+    def stop(self):
+        self.running = False
+        self.wait()
+
+    def run(self):
+        pin_inference_thread()
+        slot = 0
+        while self.running:
+            ret, raw = self.cap.read(self.raw)
+            if not ret:
+                time.sleep(CAMERA_RETRY_SECONDS)
+                continue
+            self.raw = raw
+            now = self.clock()
+
+            dst = self.slots[slot]
+            if dst is None or dst.shape != raw.shape:
+                dst = self.slots[slot] = np.empty_like(raw)
+            frame, points, fresh = self.analyze(raw, now, dst)
+
+            with self.lock:
+                self.results[slot] = (frame, points, fresh, now)
+                if self.latest is not None:
+                    self.coalesced += 1
+                self.latest = slot
+                notify = not self.signalled
+                self.signalled = True
+                slot = next(
+                    i for i in range(FRAME_SLOTS)
+                    if i != self.latest and i != self.in_use
+                )
+
+            if notify:
+                self.frame_ready.emit()
+
+    def take(self):
+        # Newest (frame, points, fresh, capture time), or None
+        with self.lock:
+            self.signalled = False
+            if self.latest is None:
+                return None
+            self.in_use = self.latest
+            self.latest = None
+            return self.results[self.in_use]
+
+
+class FrameTiming:
+    # Interval between processed frames (its SD is the jitter) and
+    # capture-to-processing latency, per session.
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.intervals = SessionStats()
+        self.latency = SessionStats()
+        self.last = None
+
+    def add(self, now, captured):
+        if self.last is not None:
+            self.intervals.add(now - self.last)
+        self.last = now
+        self.latency.add(now - captured)
+
+    def summary(self, coalesced=0):
+        iv = self.intervals
+        return {
+            "frames": self.latency.count,
+            "fps": 1.0 / iv.mean if iv.mean > 0 else 0.0,
+            "interval_ms": iv.mean * 1000,
+            "jitter_ms": iv.stddev * 1000,
+            "p90_interval_ms": iv.p90.value() * 1000,
+            "max_interval_ms": iv.max * 1000,
+            "latency_ms": self.latency.mean * 1000,
+            "coalesced": coalesced
+        }
+
+
 # ============================================================
 # ====================== GAME WIDGET =========================
 # ============================================================
 
+class VideoView(QWidget):
+    # Paints an RGB frame buffer directly; the QImage wraps the buffer
+    # and is only rebuilt when the buffer itself changes.
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.buffer = None
+        self.image = None
+
+    def show_frame(self, rgb):
+        if rgb is not self.buffer:
+            h, w = rgb.shape[:2]
+            self.buffer = rgb
+            self.image = QImage(rgb.data, w, h, 3 * w, QImage.Format.Format_RGB888)
+        self.update()
+
+    def paintEvent(self, event):
+        if self.image is not None:
+            painter = QPainter(self)
+            painter.drawImage(self.rect(), self.image)
+            painter.end()
+
+
 class GameWidget(QWidget):
-    def __init__(self, on_back, on_session_end):
+    def __init__(self, on_back, on_session_end, pose, camera=None, clock=time.perf_counter):
         super().__init__()
 
         self.on_back = on_back
         self.on_session_end = on_session_end
+        self.clock = clock
 
         # ---------- VIDEO ----------
-        self.video_label = QLabel(self)
-        self.video_label.setScaledContents(True)
+        self.video = VideoView(self)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self.video_label)
+        layout.addWidget(self.video)
 
         # ---------- HUD ----------
         self.hud = QWidget(self)
@@ -606,8 +2662,9 @@ class GameWidget(QWidget):
 
         self.time_label = QLabel("TIME: 30s", self.hud)
         self.kick_label = QLabel("KICKS: 0", self.hud)
+        self.avg_label = QLabel("AVG: --", self.hud)
 
-        for lbl in (self.time_label, self.kick_label):
+        for lbl in (self.time_label, self.kick_label, self.avg_label):
             lbl.setStyleSheet("""
                 QLabel {
                     color: white;
@@ -622,6 +2679,23 @@ class GameWidget(QWidget):
         self.hud_layout.addWidget(self.time_label, alignment=Qt.AlignmentFlag.AlignLeft)
         self.hud_layout.addSpacing(8)
         self.hud_layout.addWidget(self.kick_label, alignment=Qt.AlignmentFlag.AlignLeft)
+        self.hud_layout.addSpacing(8)
+        self.hud_layout.addWidget(self.avg_label, alignment=Qt.AlignmentFlag.AlignLeft)
+        self.hud_layout.addSpacing(8)
+
+        self.tracking_label = QLabel("TRACKING LOST - STEP INTO VIEW", self.hud)
+        self.tracking_label.setStyleSheet("""
+            QLabel {
+                color: white;
+                font-size: 22px;
+                font-weight: bold;
+                background-color: rgba(185,28,28,200);
+                padding: 8px 14px;
+                border-radius: 10px;
+            }
+        """)
+        self.tracking_label.hide()
+        self.hud_layout.addWidget(self.tracking_label, alignment=Qt.AlignmentFlag.AlignLeft)
         self.hud_layout.addStretch()
 
         # ---------- BACK BUTTON ----------
@@ -641,116 +2715,284 @@ class GameWidget(QWidget):
         """)
         self.back_btn.clicked.connect(self.handle_back)
 
+        self.recalibrate_btn = QPushButton("RECALIBRATE", self)
+        self.recalibrate_btn.setFixedSize(180, 44)
+        self.recalibrate_btn.setStyleSheet(self.back_btn.styleSheet())
+        self.recalibrate_btn.clicked.connect(self.recalibrate)
+
         # ---------- CAMERA & POSE ----------
-        self.cap = cv2.VideoCapture(0)
-        self.inferencer = MMPoseInferencer("human")
+        self.cap = camera if camera is not None else cv2.VideoCapture(0)
+        self.pose = pose
         self.ball_png = cv2.imread(FOOTBALL_IMAGE, cv2.IMREAD_UNCHANGED)
-
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.game_tick)
+        self.trajectory = TrajectoryBuffer()
+        self.calibrator = BodyCalibrator()
+        self.tracker = KeypointTracker()
+        self.scheduler = InferenceScheduler()
+        self.recorder = None
+        self.fps = 0.0
+        self.last_tick_time = None
+        self.body_unit = DEFAULT_BODY_UNIT
+
+        # ---------- MEMORY ----------
+        self.buffers = FrameBuffers()
+        self.capture_buf = None
+        self.sprites = {}
+        self.alloc_monitor = AllocationMonitor() if memory_debug else None
+        self.session_rss = 0
+        self.sessions = 0
+
+        # ---------- SCHEDULING ----------
+        # Frames arrive flipped and with pose results from the pipeline
+        # thread; the countdown runs on its own timer so it never depends
+        # on frame delivery.
+        self.source = FrameSource(self.cap, self.analyze, self.clock, self)
+        self.source.frame_ready.connect(self.on_frame_ready)
+        self.timing = FrameTiming()
+
+        self.countdown = QTimer(self)
+        self.countdown.timeout.connect(self.update_countdown)
 
     # ========================================================
     # ===================== CONTROL ==========================
     # ========================================================
 
-    def start(self):
-        self.game_state = reset_game_state()
-        self.start_time = time.time()
-        self.difficulty_step = DIFFICULTY_MAP[selected_difficulty]
-        self.sitting_mode = (selected_posture == "sitting")
-        self.timer.start(16)
+    def start(self, scale=None, autorun=True):
+        self.game_state = reset_game_state(self.clock())
+        self.trajectory.reset(max(RULES.session_limits()[1], selected_session_seconds))
+        self.tracker.reset()
+        self.scheduler.reset()
+        self.tracking_label.hide()
+        self.last_tick_time = None
+        self.timing.reset()
+
+        if self.alloc_monitor is not None:
+            self.alloc_monitor.reset()
+        self.session_rss = current_rss()
+
+        if scale is None and not recalibrate_next_session:
+            scale = load_calibration(RULES.path and RULES.name)
+        if scale is None:
+            self.calibrating = True
+            self.calibrator.reset()
+            self.calibration_start = self.clock()
+            self.body_unit = DEFAULT_BODY_UNIT
+            self.time_label.setText("CALIBRATING... STAND STILL")
+            self.kick_label.setText("KICKS: 0")
+            self.avg_label.setText("AVG: --")
+            self.apply_rules()
+        else:
+            self.begin_session(scale)
+
+        if autorun:
+            self.source.start()
+            self.countdown.start(COUNTDOWN_INTERVAL_MS)
+
+    def begin_session(self, scale):
+        self.calibrating = False
+        self.body_unit = float(scale["hip_width"])
+        self.apply_rules()
+
+        now = self.clock()
+        self.start_time = now
+        self.game_state["ball_spawn_time"] = now
+        self.game_state["last_kick_time"] = now - 10
+        self.time_label.setText(f"TIME: {selected_session_seconds}s")
+        self.update_kick_labels()
+
+        if recording_options is not None:
+            if self.recorder is None:
+                self.recorder = SessionRecorder(**recording_options)
+            self.recorder.start(recording_path(RULES.name, self.recorder.codec))
+
+    def finish_calibration(self):
+        global recalibrate_next_session
+        scale = self.calibrator.estimate(selected_posture)
+        save_calibration(RULES.path and RULES.name, scale)
+        recalibrate_next_session = False
+        self.begin_session(scale)
+
+    def apply_rules(self):
+        # Pointer swap to the precompiled table; safe mid-session.
+        self.rules = RULES.table(selected_posture, selected_difficulty).scaled(self.body_unit)
+        if self.game_state["pattern_index"] >= len(self.rules.sides):
+            self.game_state["pattern_index"] = 0
+        if self.game_state["level"] >= len(self.rules.heights):
+            self.game_state["level"] = len(self.rules.heights) - 1
+
+    def is_running(self):
+        return self.countdown.isActive()
 
     def stop(self):
-        self.timer.stop()
+        self.countdown.stop()
+        self.source.stop()
+        if self.recorder is not None:
+            self.recorder.stop()
+
+    def recalibrate(self):
+        # Restart the session with a fresh body measurement
+        global recalibrate_next_session
+        recalibrate_next_session = True
+        self.stop()
+        self.start()
 
     def handle_back(self):
         self.stop()
         self.on_back()
 
+    def end_session(self):
+        self.stop()
+        timing = self.timing.summary(self.source.coalesced)
+        self.game_state["frame_timing"] = timing
+        if frame_stats:
+            print(f"[frames] {timing['frames']} frames at {timing['fps']:.1f} fps, "
+                  f"interval {timing['interval_ms']:.1f} ms ± {timing['jitter_ms']:.1f} ms "
+                  f"(p90 {timing['p90_interval_ms']:.1f}, max {timing['max_interval_ms']:.1f}), "
+                  f"latency {timing['latency_ms']:.1f} ms, {timing['coalesced']} coalesced")
+
+        self.game_state["kinematics"] = compute_kinematics(
+            self.trajectory.samples(), self.rules.hold_time, self.body_unit
+        )
+
+        self.sessions += 1
+        rss = current_rss()
+        memory = {"rss": rss, "rss_delta": rss - self.session_rss}
+        if self.alloc_monitor is not None:
+            memory.update(self.alloc_monitor.summary())
+        self.game_state["memory"] = memory
+        if memory_debug:
+            print(f"[memory] session {self.sessions}: rss {rss / 2**20:.1f} MB "
+                  f"({memory['rss_delta'] / 2**20:+.2f} MB), "
+                  f"~{memory.get('avg_tick_bytes', 0) / 1024:.1f} KB allocated per tick")
+
+        self.on_session_end(self.game_state)
+
     # ========================================================
     # ===================== GAME LOOP ========================
     # ========================================================
 
-    def game_tick(self):
-        ret, frame = self.cap.read()
-        if not ret:
-            return
-
-        if FLIP_FRAME:
-            frame = cv2.flip(frame, 1)
-
-        elapsed = time.time() - self.start_time
-        time_left = max(0, int(SESSION_TIME_SECONDS - elapsed))
+    def time_left(self, now):
+        return max(0, int(selected_session_seconds - (now - self.start_time)))
 
+    def update_countdown(self):
+        if self.calibrating:
+            return
+        time_left = self.time_left(self.clock())
         if time_left <= 0:
-            self.stop()
-            self.on_session_end(self.game_state)
+            self.end_session()
             return
+        text = f"TIME: {time_left}s"
+        if self.time_label.text() != text:
+            self.time_label.setText(text)
 
-        self.time_label.setText(f"TIME: {time_left}s")
+    def update_kick_labels(self):
         self.kick_label.setText(f"KICKS: {self.game_state['total_kicks']}")
+        stats = self.game_state["kick_stats"]
+        if stats.count:
+            self.avg_label.setText(f"AVG: {stats.mean:.2f}s  ± {stats.stddev:.2f}s")
+        else:
+            self.avg_label.setText("AVG: --")
 
-        result = next(self.inferencer(frame, show=False))
-        preds = result.get("predictions", [])
-
-        if preds and preds[0] and len(preds[0][0]["keypoints"]) >= 15:
-            keypoints = preds[0][0]["keypoints"]
+    def on_frame_ready(self):
+        if not self.is_running():
+            return
+        result = self.source.take()
+        if result is not None:
+            self.tick(result)
+
+    def analyze(self, raw, now, dst):
+        # Pipeline stage (capture thread, or inline for the soak test):
+        # flip or copy into dst, then pose and keypoint tracking
+        if self.rules.flip:
+            frame = cv2.flip(raw, 1, dst=dst)
+        else:
+            np.copyto(dst, raw)
+            frame = dst
 
-            lx, ly = unpack_xy(keypoints[11])
-            rx, ry = unpack_xy(keypoints[12])
-            hip_x = (lx + rx) / 2
-            hip_y = (ly + ry) / 2
+        if self.scheduler.should_infer():
+            points, fresh = self.tracker.update(self.pose(frame), now)
+            self.scheduler.report(fresh)
+        else:
+            points, fresh = self.tracker.held(now)
+        return frame, points, fresh
 
-            k0x, k0y = unpack_xy(keypoints[13])
-            k1x, k1y = unpack_xy(keypoints[14])
+    def tick(self, result=None):
+        monitor = self.alloc_monitor
+        if monitor is None:
+            self.game_tick(result)
+            return
+        monitor.before_tick()
+        try:
+            self.game_tick(result)
+        finally:
+            monitor.after_tick()
+
+    def game_tick(self, result):
+        # Without a pipeline result (soak test), capture and analyse here
+        if result is None:
+            ret, raw = self.cap.read(self.capture_buf)
+            if not ret:
+                return
+            self.capture_buf = raw
+            captured = self.clock()
+            frame, points, fresh = self.analyze(
+                raw, captured, self.buffers.get("flipped", raw.shape)
+            )
+        else:
+            frame, points, fresh, captured = result
 
-            # Identify left/right knee by X position
-            if k0x <= k1x:
-                left_knee = (int(k0x), int(k0y))
-                right_knee = (int(k1x), int(k1y))
-            else:
-                left_knee = (int(k1x), int(k1y))
-                right_knee = (int(k0x), int(k0y))
+        rules = self.rules
+        now = self.clock()
+        self.timing.add(now, captured)
 
-            # -------- DRAW KNEE TRACKERS --------
-            cv2.circle(frame, left_knee, 14, (0, 255, 0), -1)   # GREEN
-            cv2.circle(frame, right_knee, 14, (0, 0, 255), -1) # RED
+        if self.last_tick_time is not None and now > self.last_tick_time:
+            self.fps = 0.9 * self.fps + 0.1 / (now - self.last_tick_time)
+        self.last_tick_time = now
+        time_left = None
 
-            side = self.game_state["BALL_SIDES"][self.game_state["current_side_index"]]
-            knee_x, knee_y = left_knee if side == "left" else right_knee
+        if not self.calibrating:
+            time_left = self.time_left(now)
+            if time_left <= 0:
+                self.end_session()
+                return
 
-            offset = BALL_HORIZONTAL_OFFSET * (0.6 if self.sitting_mode else 1.0)
-            ball_x = hip_x - offset if side == "left" else hip_x + offset
-            ball_y = hip_y - self.difficulty_step
+        if self.tracking_label.isHidden() != (points is not None):
+            self.tracking_label.setVisible(points is None)
 
+        if points is not None:
+            (hip_x, hip_y), left_knee, right_knee = split_points(points)
 
-            now = time.time()
-            dist = math.dist((knee_x, knee_y), (ball_x, ball_y))
-            inside = dist <= HIT_RADIUS
+            # -------- DRAW KNEE TRACKERS --------
+            cv2.circle(frame, left_knee, 14, (0, 255, 0), -1)   # GREEN
+            cv2.circle(frame, right_knee, 14, (0, 0, 255), -1) # RED
 
-            if inside:
-                if not self.game_state["in_ball"]:
-                    self.game_state["in_ball"] = True
-                    self.game_state["in_ball_since"] = now
-                else:
-                    if (
-                        not self.game_state["must_leave_ball"]
-                        and (now - self.game_state["in_ball_since"]) >= HOLD_TIME
-                        and (now - self.game_state["last_kick_time"]) >= MIN_KICK_INTERVAL
-                    ):
-                        self.game_state["kick_times"].append(now - self.game_state["ball_spawn_time"])
-                        self.game_state["total_kicks"] += 1
-                        play_beep()
-
-                        self.game_state["last_hit_time"] = now
-                        self.game_state["last_kick_time"] = now
-                        self.game_state["ball_spawn_time"] = now
-                        self.game_state["must_leave_ball"] = True
-                        self.game_state["in_ball"] = False
-                        self.game_state["current_side_index"] ^= 1
-            else:
-                self.game_state["in_ball"] = False
-                self.game_state["must_leave_ball"] = False
+            if self.calibrating:
+                if fresh:
+                    self.calibrator.add(*points)
+                if (
+                    now - self.calibration_start >= CALIBRATION_SECONDS
+                    and self.calibrator.count >= CALIBRATION_MIN_SAMPLES
+                ):
+                    self.finish_calibration()
+                self.publish_monitor(frame, now, time_left, points, fresh)
+                self.render(frame)
+                return
+
+            if fresh:
+                self.trajectory.append(
+                    now - self.start_time,
+                    (hip_x, hip_y),
+                    left_knee,
+                    right_knee,
+                    rules.sides[self.game_state["pattern_index"]] + 1
+                    if self.game_state["in_ball"] else 0
+                )
+
+            ball_x, ball_y, kicked = judge_kick(
+                self.game_state, rules, hip_x, hip_y, left_knee, right_knee, fresh, now
+            )
+            if kicked:
+                self.update_kick_labels()
+                play_beep()
 
             self.draw_ball(
                 frame,
@@ -759,40 +3001,76 @@ class GameWidget(QWidget):
                 now - self.game_state["last_hit_time"] < 0.3
             )
 
+        if self.recorder is not None and self.recorder.recording:
+            self.recorder.submit(frame, captured)
+
+        self.publish_monitor(
+            frame, now, time_left, points, fresh,
+            (ball_x, ball_y) if points is not None else None
+        )
         self.render(frame)
 
+    def publish_monitor(self, frame, now, time_left, points, fresh, ball=None):
+        if monitor_server is None:
+            return
+
+        tick = {
+            "kicks": self.game_state["total_kicks"],
+            "time_left": time_left,
+            "fps": round(self.fps, 1),
+            "calibrating": self.calibrating,
+            "tracking": "lost" if points is None else ("ok" if fresh else "held")
+        }
+        if points is not None:
+            tick["left_knee"] = [round(v, 1) for v in points[2]]
+            tick["right_knee"] = [round(v, 1) for v in points[3]]
+        if ball is not None:
+            tick["ball"] = [round(ball[0], 1), round(ball[1], 1)]
+
+        monitor_server.publish_tick(tick, now)
+        monitor_server.offer_frame(frame, now)
+
     # ========================================================
     # ===================== DRAW =============================
     # ========================================================
 
+    def sprite(self, size):
+        # Resized ball colour with float32 alpha / inverse alpha weights,
+        # cached per size so blending allocates nothing
+        sprite = self.sprites.get(size)
+        if sprite is None:
+            if len(self.sprites) >= SPRITE_CACHE_SIZE:
+                self.sprites.clear()
+            ball = cv2.resize(self.ball_png, (size, size))
+            alpha = ball[:, :, 3].astype(np.float32) / 255.0
+            sprite = (np.ascontiguousarray(ball[:, :, :3]), alpha, 1.0 - alpha)
+            self.sprites[size] = sprite
+        return sprite
+
     def draw_ball(self, frame, x, y, glow):
+        radius = self.rules.ball_radius
         if glow:
-            cv2.circle(frame, (x, y), BALL_RADIUS + 12, (0, 255, 0), -1)
+            cv2.circle(frame, (x, y), radius + 12, (0, 255, 0), -1)
 
-        size = BALL_RADIUS * (2 + (0.2 if glow else 0))
-        ball = cv2.resize(self.ball_png, (int(size), int(size)))
-        h, w = ball.shape[:2]
+        size = int(radius * (2 + (0.2 if glow else 0)))
+        color, alpha, inv_alpha = self.sprite(size)
+        h, w = size, size
         x1, y1 = x - w // 2, y - h // 2
 
         if x1 < 0 or y1 < 0 or x1 + w > frame.shape[1] or y1 + h > frame.shape[0]:
             return
 
-        alpha = ball[:, :, 3] / 255.0
-        for c in range(3):
-            frame[y1:y1+h, x1:x1+w, c] = (
-                alpha * ball[:, :, c] +
-                (1 - alpha) * frame[y1:y1+h, x1:x1+w, c]
-            )
+        roi = frame[y1:y1+h, x1:x1+w]
+        cv2.blendLinear(color, roi, alpha, inv_alpha, dst=roi)
 
     def resizeEvent(self, e):
         self.hud.setGeometry(0, 0, self.width(), self.height())
         self.back_btn.move(self.width() - 160, 20)
+        self.recalibrate_btn.move(self.width() - 360, 20)
 
     def render(self, frame):
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w = frame.shape[:2]
-        img = QImage(rgb.data, w, h, 3 * w, QImage.Format.Format_RGB888)
-        self.video_label.setPixmap(QPixmap.fromImage(img))
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self.buffers.get("rgb", frame.shape))
+        self.video.show_frame(rgb)
 
 
 # ============================================================
@@ -808,7 +3086,8 @@ class ScorecardScreen(QWidget):
 
         # ---------- BACKGROUND ----------
         self.bg = QLabel(self)
-        self.bg_pixmap = QPixmap(BACKGROUND_IMAGE)
+        self.bg_path = BACKGROUND_IMAGE
+        self.bg_pixmap = QPixmap(self.bg_path)
         self.bg.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         # ---------- DARK OVERLAY ----------
@@ -889,30 +3168,33 @@ class ScorecardScreen(QWidget):
     # ---------- UPDATE STATS ----------
     def set_stats(self, game_state, duration):
         kicks = game_state["total_kicks"]
-        times = game_state["kick_times"]
-
-        avg = sum(times) / len(times) if times else 0
-        best = min(times) if times else 0
+        stats = game_state["kick_stats"]
 
         self.stats_label.setText(
             f"Kicks: {kicks}\n"
-            f"Average Kick Time: {avg:.2f}s\n"
-            f"Best Kick Time: {best:.2f}s\n"
+            f"Average Kick Time: {stats.mean:.2f}s\n"
+            f"Best Kick Time: {stats.min:.2f}s\n"
+            f"Median / 90th Percentile: {stats.median.value():.2f}s / {stats.p90.value():.2f}s\n"
+            f"Consistency (SD): {stats.stddev:.2f}s\n"
             f"Time Played: {int(duration)}s"
         )
 
+        kin = game_state.get("kinematics")
+        if kin:
+            self.stats_label.setText(
+                self.stats_label.text() + "\n\n"
+                f"Knee Lift L / R: {kin['lift_left']:.2f} / {kin['lift_right']:.2f} hip widths\n"
+                f"Peak Knee Speed L / R: {kin['peak_speed_left']:.1f} / {kin['peak_speed_right']:.1f} hip widths/s\n"
+                f"Left/Right Symmetry: {kin['symmetry']:.0f}%\n"
+                f"Hold Sway: {kin['hold_sway']:.2f} hip widths"
+            )
+
         # Let Qt resize the card based on content
         self.container.adjustSize()
 
     # ---------- RESIZE ----------
     def resizeEvent(self, e):
-        self.bg.setPixmap(
-            self.bg_pixmap.scaled(
-                self.size(),
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation
-            )
-        )
+        self.bg.setPixmap(background_pixmap(self.bg_path, self.bg_pixmap, self.size()))
         self.bg.resize(self.size())
 
         self.overlay.setGeometry(0, 0, self.width(), self.height())
@@ -946,55 +3228,176 @@ class MainWindow(QMainWindow):
         self.posture = PostureScreen(self.go_to_difficulty, self.go_to_instructions)
         self.difficulty = DifficultyScreen(self.go_to_time_select, self.go_to_posture)
         self.time_select = TimeSelectScreen(self.start_game, self.go_to_difficulty)
-        self.game = GameWidget(self.back_from_game, self.show_scorecard)
         self.scorecard = ScorecardScreen(self.retry_game, self.back_to_menu)
 
+        # Created once the vision stack has loaded (see on_vision_ready)
+        self.game = None
+        self.pending_start = False
+        self.pending_session_seconds = None
+
         for w in (
             self.splash,
             self.instructions,
             self.posture,
             self.difficulty,
             self.time_select,
-            self.game,
             self.scorecard
         ):
             self.stack.addWidget(w)
 
         self.stack.setCurrentWidget(self.splash)
 
+        # ---------- PRE-RENDERING ----------
+        self.menu_screens = (
+            self.splash,
+            self.instructions,
+            self.posture,
+            self.difficulty,
+            self.time_select,
+            self.scorecard
+        )
+        self.prerenderer = None
+        self.prerendered_size = None
+        self.prerender_timer = QTimer(self)
+        self.prerender_timer.setSingleShot(True)
+        self.prerender_timer.timeout.connect(self.prerender)
+
+        # ---------- PROFILE HOT RELOAD ----------
+        self.profile_watcher = QFileSystemWatcher(self)
+        if RULES.path:
+            self.profile_watcher.addPath(RULES.path)
+        self.profile_watcher.fileChanged.connect(self.reload_rules)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # Wait for the window size to settle (e.g. going full-screen)
+        self.prerender_timer.start(150)
+
+    def prerender(self):
+        size = self.centralWidget().size()
+        if size == self.prerendered_size:
+            return
+        if self.prerenderer is not None and self.prerenderer.isRunning():
+            self.prerender_timer.start(150)
+            return
+
+        self.prerendered_size = size
+        self.prerenderer = Prerenderer(
+            size,
+            sorted({w.bg_path for w in self.menu_screens}),
+            self.splash.prerender_buttons(size),
+            self
+        )
+        self.prerenderer.rendered.connect(self.store_prerendered)
+        self.prerenderer.start()
+
+    def store_prerendered(self, size, backgrounds, buttons):
+        if size != self.prerendered_size:
+            return
+
+        SCALED_BACKGROUNDS.clear()
+        for path, img in backgrounds.items():
+            SCALED_BACKGROUNDS[(path, size.width(), size.height())] = QPixmap.fromImage(img)
+
+        BUTTON_STATES.clear()
+        for key, states in buttons.items():
+            BUTTON_STATES[key] = tuple(QPixmap.fromImage(img) for img in states)
+
+        self.splash.play_btn.refresh_states()
+        self.splash.exit_btn.refresh_states()
+
+    def on_vision_ready(self, pose):
+        self.game = GameWidget(self.back_from_game, self.show_scorecard, pose)
+        self.stack.addWidget(self.game)
+
+        self.time_select.next_btn.setText("START")
+        if self.pending_start:
+            self.pending_start = False
+            self.start_game()
+
+    def on_vision_failed(self, message):
+        print(f"[vision] failed to load: {message}")
+        self.pending_start = False
+        self.time_select.next_btn.setText("CAMERA ERROR")
+
+    def reload_rules(self, path):
+        # Editors often replace the file, which drops it from the watcher
+        if os.path.isfile(path) and path not in self.profile_watcher.files():
+            self.profile_watcher.addPath(path)
+
+        seconds = RULES.profile["session"]["seconds"]
+        if RULES.reload():
+            print(f"[rules] reloaded {path}")
+            # A changed session length applies from the next session
+            if RULES.profile["session"]["seconds"] != seconds:
+                self.pending_session_seconds = int(RULES.profile["session"]["seconds"])
+            if self.game is not None and self.game.is_running():
+                self.game.apply_rules()
+            else:
+                self.apply_session_seconds()
+            self.time_select.update_label()
+
+    def apply_session_seconds(self):
+        global selected_session_seconds
+        if self.pending_session_seconds is not None:
+            selected_session_seconds = self.pending_session_seconds
+            self.pending_session_seconds = None
+            self.time_select.update_label()
+
     def go_to_splash(self):
+        self.cancel_pending_start()
         self.stack.setCurrentWidget(self.splash)
 
     def go_to_instructions(self):
+        self.cancel_pending_start()
         self.stack.setCurrentWidget(self.instructions)
 
     def go_to_posture(self):
+        self.cancel_pending_start()
         self.stack.setCurrentWidget(self.posture)
 
     def go_to_difficulty(self):
+        self.cancel_pending_start()
         self.stack.setCurrentWidget(self.difficulty)
 
     def go_to_time_select(self):
         self.stack.setCurrentWidget(self.time_select)
 
     def start_game(self):
+        if self.game is None:
+            self.pending_start = True
+            self.time_select.next_btn.setText("LOADING...")
+            return
+        self.apply_session_seconds()
         self.stack.setCurrentWidget(self.game)
         self.game.start()
 
     def back_from_game(self):
         self.game.stop()
+        self.apply_session_seconds()
         self.stack.setCurrentWidget(self.time_select)
 
     def show_scorecard(self, game_state):
-        self.scorecard.set_stats(game_state, SESSION_TIME_SECONDS)
+        self.scorecard.set_stats(game_state, selected_session_seconds)
+        if monitor_server is not None:
+            monitor_server.publish_scorecard(
+                session_summary(game_state, selected_session_seconds)
+            )
         self.stack.setCurrentWidget(self.scorecard)
 
     def retry_game(self):
         self.start_game()
 
     def back_to_menu(self):
+        self.cancel_pending_start()
         self.stack.setCurrentWidget(self.posture)
 
+    def cancel_pending_start(self):
+        # The user left the time screen before the vision stack loaded
+        if self.pending_start:
+            self.pending_start = False
+            self.time_select.next_btn.setText("START")
+
     def exit_app(self):
         try:
             self.game.stop()
@@ -1007,15 +3410,567 @@ class MainWindow(QMainWindow):
             self.exit_app()
 
 
+# ============================================================
+# ======================= SIMULATION =========================
+# ============================================================
+
+SIM_BODY_UNIT = 40.0
+SIM_FPS = 30
+SIM_HIP = (160.0, 140.0)
+
+# Resting knee position relative to the hip centre, in body units. Both
+# rest outside every ball's hit radius, so each return re-arms the ball.
+REST_KNEES = {
+    "standing": (0.5, 1.6),
+    "sitting": (0.5, 0.9)
+}
+
+
+class SimulatedClock:
+    def __init__(self, start=0.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class SyntheticCamera:
+    # cv2.VideoCapture stand-in serving a fixed frame into the caller's buffer
+    def __init__(self, size):
+        w, h = size
+        self.frame = np.zeros((h, w, 3), dtype=np.uint8)
+        self.frame[:, :, 1] = np.linspace(40, 120, w, dtype=np.uint8)
+
+    def isOpened(self):
+        return True
+
+    def read(self, image=None):
+        if image is None or image.shape != self.frame.shape:
+            return True, self.frame.copy()
+        np.copyto(image, self.frame)
+        return True, image
+
+    def release(self):
+        pass
+
+
+def smoothstep(x):
+    return x * x * (3 - 2 * x)
+
+
+def aim_at_ball(game_state, rules):
+    # Lets a SyntheticPose aim at the ball the game is showing
+    return lambda: (rules.sides[game_state["pattern_index"]], game_state["level"])
+
+
+class SyntheticPose:
+    # Pose source producing COCO-style predictions for a patient repeating
+    # rest -> reach -> hold -> return. Each attempt aims at aim() (side,
+    # level), or follows the rule pattern if no aim is given. speed scales
+    # rest and reach times, noise is in body units and dropout is the
+    # chance of a frame with no detection. Seeded, so runs repeat exactly.
+    def __init__(self, clock, table, posture="standing", hip=SIM_HIP, unit=SIM_BODY_UNIT,
+                 hold=0.8, rest=0.5, reach=0.25, speed=1.0, noise=0.0, dropout=0.0,
+                 seed=0, aim=None):
+        self.clock = clock
+        self.table = table.scaled(unit)
+        self.hip = hip
+        self.unit = unit
+        self.rest_knees = tuple(v * unit for v in REST_KNEES[posture])
+        self.hold = hold
+        self.rest = rest / speed
+        self.reach = reach / speed
+        self.noise = noise * unit
+        self.dropout = dropout
+        self.seed = seed
+        self.aim = aim
+        self.scores = [0.95] * 17
+        self.reset(clock())
+
+        # A resting knee inside a ball never re-arms it (must_leave_ball)
+        dx, dy = self.rest_knees
+        table = self.table
+        if any((table.offset - dx) ** 2 + (h + dy) ** 2 <= table.hit_radius_sq
+               for h in table.heights):
+            print(f"[simulate] {posture} resting knee is inside a ball's hit radius; "
+                  f"kicks will not re-arm")
+
+    def reset(self, now):
+        self.t0 = now
+        self.rng = random.Random(self.seed)
+        self.attempts = 0
+        self.target = None
+
+    def knees(self, now):
+        hx, hy = self.hip
+        dx, dy = self.rest_knees
+        left = [hx - dx, hy + dy]
+        right = [hx + dx, hy + dy]
+
+        period = self.rest + 2 * self.reach + self.hold
+        t = now - self.t0
+        step = int(t // period)
+        phase = t - step * period - self.rest
+        if phase <= 0:
+            return left, right
+
+        # Pick the target once per attempt, as a patient would
+        if self.attempts <= step:
+            self.attempts = step + 1
+            if self.aim is not None:
+                side, level = self.aim()
+            else:
+                table = self.table
+                side = table.sides[step % len(table.sides)]
+                level = min(
+                    step // table.kicks_per_step if table.kicks_per_step else 0,
+                    len(table.heights) - 1
+                )
+            offset = -self.table.offset if side == SIDE_LEFT else self.table.offset
+            self.target = (side, hx + offset, hy - self.table.heights[level])
+
+        if phase < self.reach:
+            f = smoothstep(phase / self.reach)
+        elif phase < self.reach + self.hold:
+            f = 1.0
+        else:
+            f = smoothstep(max(0.0, 1 - (phase - self.reach - self.hold) / self.reach))
+
+        side, tx, ty = self.target
+        knee = left if side == SIDE_LEFT else right
+        knee[0] += (tx - knee[0]) * f
+        knee[1] += (ty - knee[1]) * f
+        return left, right
+
+    def __call__(self, frame):
+        hx, hy = self.hip
+        left, right = self.knees(self.clock())
+
+        # Draw from the generator every frame so runs stay in lockstep
+        dropped = self.rng.random() < self.dropout
+        keypoints = [[0.0, 0.0]] * 17
+        keypoints[11] = [hx - self.unit / 2, hy]
+        keypoints[12] = [hx + self.unit / 2, hy]
+        keypoints[13] = left
+        keypoints[14] = right
+        if self.noise:
+            gauss = self.rng.gauss
+            for i in LOWER_BODY:
+                x, y = keypoints[i]
+                keypoints[i] = [x + gauss(0, self.noise), y + gauss(0, self.noise)]
+
+        if dropped:
+            return [[]]
+        return [[{"keypoints": keypoints, "keypoint_scores": self.scores}]]
+
+
+def simulate_session(game_state, rules, pose, clock, seconds, fps=SIM_FPS):
+    # Decision logic only (tracker + judge_kick) on a simulated clock;
+    # returns the number of frames and the time of each kick.
+    tracker = KeypointTracker()
+    start = clock()
+    frames = int(seconds * fps)
+    kicks = []
+    for _ in range(frames):
+        clock.advance(1.0 / fps)
+        now = clock()
+        points, fresh = tracker.update(pose(None), now)
+        if points is None:
+            continue
+        (hip_x, hip_y), left_knee, right_knee = split_points(points)
+        if judge_kick(game_state, rules, hip_x, hip_y, left_knee, right_knee, fresh, now)[2]:
+            kicks.append(now - start)
+    return frames, kicks
+
+
+def run_simulation(sessions, seconds, fps=SIM_FPS, posture="standing", difficulty=1,
+                   noise=0.0, dropout=0.0, speed=1.0, hold=None, seed=0):
+    # Headless, deterministic sessions against the current rules. The
+    # digest changes whenever any kick lands on a different frame, which
+    # makes it easy to compare rule or logic changes.
+    table = RULES.table(posture, difficulty)
+    rules = table.scaled(SIM_BODY_UNIT)
+    if hold is None:
+        hold = table.hold_time + 0.3
+
+    clock = SimulatedClock()
+    pose = SyntheticPose(clock, table, posture, hold=hold, speed=speed,
+                         noise=noise, dropout=dropout, seed=seed)
+
+    digest = hashlib.sha256()
+    kicks, attempts, kick_times = [], [], SessionStats()
+    frames = 0
+    start = time.perf_counter()
+    for i in range(sessions):
+        game_state = reset_game_state(clock())
+        pose.aim = aim_at_ball(game_state, rules)
+        pose.reset(clock())
+
+        n, times = simulate_session(game_state, rules, pose, clock, seconds, fps)
+        frames += n
+        kicks.append(game_state["total_kicks"])
+        attempts.append(pose.attempts)
+        if game_state["kick_stats"].count:
+            kick_times.add(game_state["kick_stats"].mean)
+        digest.update(json.dumps([round(t, 6) for t in times]).encode())
+    elapsed = time.perf_counter() - start
+
+    print(f"[simulate] {posture}, difficulty {difficulty}, {RULES.name} rules, "
+          f"hold {hold:.2f}s, speed {speed:g}, noise {noise:g}, dropout {dropout:g}, seed {seed}")
+    print(f"[simulate] {sessions} x {seconds}s at {fps} fps: {frames} frames in {elapsed:.2f}s "
+          f"({frames / elapsed:,.0f} frames/s)")
+    print(f"[simulate] kicks {sum(kicks) / sessions:.1f}/session "
+          f"from {sum(attempts) / sessions:.1f} attempts, "
+          f"mean kick time {kick_times.mean:.2f}s")
+    print(f"[simulate] digest {digest.hexdigest()[:16]}")
+    return 0
+
+
+# ============================================================
+# ======================== SOAK TEST =========================
+# ============================================================
+
+SOAK_FRAME_SIZE = (320, 240)
+SOAK_FPS = 30
+SOAK_TRACED_LIMIT = 512 * 1024      # bytes of Python heap growth allowed
+SOAK_RSS_LIMIT = 32 * 2**20         # bytes of RSS growth allowed
+
+
+def run_soak(sessions, seconds):
+    # Headless: runs full GameWidget sessions on a simulated clock and
+    # checks that Python heap and RSS stay flat after warm-up.
+    global selected_session_seconds, sound_enabled, memory_debug
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    load_vision_stack(with_pose=False)
+    selected_session_seconds = seconds
+    sound_enabled = False
+    memory_debug = False
+
+    app = QApplication([sys.argv[0]])
+    clock = SimulatedClock()
+    kicker = SyntheticPose(clock, RULES.table(selected_posture, selected_difficulty),
+                           selected_posture)
+    scale = {"hip_width": SIM_BODY_UNIT, "thigh_length": 1.6 * SIM_BODY_UNIT}
+
+    ended = []
+    game = GameWidget(lambda: None, ended.append, kicker,
+                      camera=SyntheticCamera(SOAK_FRAME_SIZE), clock=clock)
+    game.alloc_monitor = AllocationMonitor()
+    kicker.aim = lambda: (game.rules.sides[game.game_state["pattern_index"]],
+                          game.game_state["level"])
+    game.resize(*SOAK_FRAME_SIZE)
+    game.show()
+
+    traced, rss, kicks = [], [], []
+    ticks = 0
+    start = time.perf_counter()
+    for i in range(sessions):
+        ended.clear()
+        game.start(scale, autorun=False)
+        kicker.reset(clock())
+        while not ended:
+            clock.advance(1.0 / SOAK_FPS)
+            game.tick()
+            app.processEvents()
+            ticks += 1
+
+        kicks.append(ended[0]["total_kicks"])
+        ended.clear()
+        gc.collect()
+        traced.append(tracemalloc.get_traced_memory()[0])
+        rss.append(current_rss())
+
+        if (i + 1) % 100 == 0 or i + 1 == sessions:
+            print(f"[soak] {i + 1}/{sessions} sessions, "
+                  f"heap {traced[-1] / 2**20:.2f} MB, rss {rss[-1] / 2**20:.1f} MB")
+
+    elapsed = time.perf_counter() - start
+    warm = min(len(traced) - 1, max(1, sessions // 10))
+    traced_growth = traced[-1] - traced[warm]
+    rss_growth = rss[-1] - rss[warm]
+    per_tick = game.alloc_monitor.summary()
+
+    print(f"[soak] {sessions} sessions, {ticks} ticks in {elapsed:.1f}s "
+          f"({ticks / elapsed:.0f} ticks/s), {sum(kicks) / len(kicks):.1f} kicks/session")
+    print(f"[soak] per tick (last session): ~{per_tick['avg_tick_bytes'] / 1024:.1f} KB "
+          f"allocated, max {per_tick['max_tick_bytes'] / 1024:.1f} KB")
+    print(f"[soak] growth after warm-up: heap {traced_growth / 1024:+.1f} KB, "
+          f"rss {rss_growth / 2**20:+.2f} MB")
+
+    ok = traced_growth <= SOAK_TRACED_LIMIT and rss_growth <= SOAK_RSS_LIMIT
+    print("[soak] PASS: memory is flat" if ok else "[soak] FAIL: memory keeps growing")
+    return 0 if ok else 1
+
+
 # ============================================================
 # ================= APPLICATION ENTRY ========================
 # ============================================================
 
+def report_splash_time(profiler):
+    # Runs on the first event-loop pass, i.e. after the splash is painted
+    elapsed = time.perf_counter() - APP_START
+    profiler.report("before splash")
+    status = "within" if elapsed <= STARTUP_BUDGET_SECONDS else "OVER"
+    print(f"[startup] splash shown after {elapsed:.3f}s "
+          f"({status} {STARTUP_BUDGET_SECONDS}s budget)")
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="KickSitStand rehab trainer")
+    parser.add_argument(
+        "--profile",
+        help=f"patient profile name in {PROFILE_DIR} or a path to a .toml/.json file"
+    )
+    parser.add_argument(
+        "--recalibrate",
+        action="store_true",
+        help="measure body scale again instead of using the cached calibration"
+    )
+    parser.add_argument(
+        "--rebuild-model-cache",
+        action="store_true",
+        help=f"resolve and download the pose models again into {MODEL_CACHE_DIR}"
+    )
+    parser.add_argument(
+        "--fused-model",
+        action="store_true",
+        help="use a pre-fused (conv+BN folded) pose model from the cache"
+    )
+    parser.add_argument(
+        "--precision",
+        choices=("fp32", "int8", "bf16"),
+        default="fp32",
+        help="CPU inference precision: dynamic INT8 quantization or bfloat16 autocast"
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        help="torch intra-op threads (leave a core free for the UI)"
+    )
+    parser.add_argument(
+        "--cpu-affinity",
+        help="CPUs for the capture/inference thread and its torch workers, "
+             "e.g. 1-3 (Linux only); the GUI thread is not pinned"
+    )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help=f"save a video of each session with overlays to {RECORDING_DIR}"
+    )
+    parser.add_argument(
+        "--record-codec",
+        choices=tuple(RECORDING_CODECS),
+        default="mp4v",
+        help="FourCC of the recording codec"
+    )
+    parser.add_argument(
+        "--record-size",
+        metavar="WxH",
+        help="recording resolution, e.g. 640x360 (default: camera resolution)"
+    )
+    parser.add_argument(
+        "--record-skip",
+        type=int,
+        default=1,
+        metavar="N",
+        help="record at 30/N frames per second"
+    )
+    parser.add_argument(
+        "--monitor",
+        action="store_true",
+        help="serve live session metrics and a preview over HTTP/WebSocket"
+    )
+    parser.add_argument(
+        "--monitor-host",
+        default="127.0.0.1",
+        help="address for the monitoring server (default: local only)"
+    )
+    parser.add_argument(
+        "--monitor-port",
+        type=int,
+        default=8765
+    )
+    parser.add_argument(
+        "--memory-debug",
+        action="store_true",
+        help="report RSS and sampled per-tick allocations after each session"
+    )
+    parser.add_argument(
+        "--frame-stats",
+        action="store_true",
+        help="report frame interval, jitter and latency after each session"
+    )
+    parser.add_argument(
+        "--soak",
+        type=int,
+        metavar="SESSIONS",
+        help="run this many simulated sessions headless, check memory stays flat and exit"
+    )
+    parser.add_argument(
+        "--soak-seconds",
+        type=int,
+        default=10,
+        help="length of each simulated soak session"
+    )
+    parser.add_argument(
+        "--simulate",
+        type=int,
+        metavar="SESSIONS",
+        help="run the kick logic on synthetic poses for this many sessions, report and exit"
+    )
+    parser.add_argument(
+        "--sim-seconds",
+        type=int,
+        help="length of each simulated session (default: the profile's session length)"
+    )
+    parser.add_argument("--sim-fps", type=int, default=SIM_FPS, help="simulated camera frame rate")
+    parser.add_argument("--sim-posture", choices=POSTURES, default="standing")
+    parser.add_argument("--sim-difficulty", type=int, choices=(1, 2, 3), default=1)
+    parser.add_argument(
+        "--sim-hold",
+        type=float,
+        help="seconds the simulated patient holds each kick (default: hold time + 0.3)"
+    )
+    parser.add_argument(
+        "--sim-speed",
+        type=float,
+        default=1.0,
+        help="movement speed multiplier for the simulated patient"
+    )
+    parser.add_argument(
+        "--sim-noise",
+        type=float,
+        default=0.03,
+        help="keypoint noise SD in hip widths"
+    )
+    parser.add_argument(
+        "--sim-dropout",
+        type=float,
+        default=0.05,
+        help="fraction of frames with no detection"
+    )
+    parser.add_argument("--sim-seed", type=int, default=0, help="random seed for noise and dropouts")
+    parser.add_argument(
+        "--profile-imports",
+        action="store_true",
+        help="print per-module cumulative import times and time to splash"
+    )
+    parser.add_argument(
+        "--full-pipeline",
+        action="store_true",
+        help="run MMPose's person detector and preprocessing on every frame (no ROI cache)"
+    )
+    parser.add_argument(
+        "--bench-preprocess",
+        nargs="?",
+        type=int,
+        const=1000,
+        metavar="FRAMES",
+        help="time and count allocations of pose input preprocessing, then exit"
+    )
+    parser.add_argument(
+        "--check-precision",
+        metavar="CLIP",
+        help="compare --precision against fp32 hip/knee keypoints on a clip and exit"
+    )
+    return parser.parse_known_args(argv[1:])
+
+
 def main():
-    app = QApplication(sys.argv)
+    global selected_session_seconds, recalibrate_next_session
+    global rebuild_model_cache, use_fused_model, inference_precision, inference_cpus
+    global recording_options, monitor_server, memory_debug, frame_stats, use_roi_cache
+
+    args, qt_args = parse_args(sys.argv)
+    recalibrate_next_session = args.recalibrate
+    rebuild_model_cache = args.rebuild_model_cache
+    use_fused_model = args.fused_model
+    inference_precision = args.precision
+    memory_debug = args.memory_debug
+    frame_stats = args.frame_stats
+    use_roi_cache = not args.full_pipeline
+
+    if args.record:
+        size = None
+        if args.record_size:
+            w, h = args.record_size.lower().split("x")
+            size = (int(w), int(h))
+        recording_options = {
+            "codec": args.record_codec,
+            "size": size,
+            "frame_skip": args.record_skip
+        }
+
+    if args.cpu_affinity:
+        if hasattr(os, "sched_setaffinity"):
+            inference_cpus = parse_cpu_list(args.cpu_affinity)
+        else:
+            print("[cpu] CPU affinity is not supported on this platform")
+
+    if args.soak:
+        sys.exit(run_soak(args.soak, args.soak_seconds))
+
+    if args.bench_preprocess:
+        load_vision_stack(with_pose=False)
+        sys.exit(bench_preprocess(args.bench_preprocess))
+
+    if args.check_precision:
+        if not os.path.isfile(args.check_precision):
+            sys.exit(f"Clip not found: {args.check_precision}")
+        pin_inference_thread()
+        load_vision_stack()
+        configure_cpu(args.threads)
+        sys.exit(check_precision(args.check_precision, args.precision))
+
+    if args.profile:
+        path = find_profile(args.profile)
+        if path is None:
+            sys.exit(f"Profile not found: {args.profile}")
+        RULES.load(path)
+        selected_session_seconds = int(RULES.profile["session"]["seconds"])
+
+    if args.simulate:
+        sys.exit(run_simulation(
+            args.simulate,
+            args.sim_seconds or selected_session_seconds,
+            args.sim_fps,
+            args.sim_posture,
+            args.sim_difficulty,
+            args.sim_noise,
+            args.sim_dropout,
+            args.sim_speed,
+            args.sim_hold,
+            args.sim_seed
+        ))
+
+    app = QApplication(sys.argv[:1] + qt_args)
     window = MainWindow()
     window.show()
-    sys.exit(app.exec())
+
+    if import_profiler is not None:
+        QTimer.singleShot(0, lambda: report_splash_time(import_profiler))
+
+    loader = VisionLoader(args.threads)
+    loader.ready.connect(window.on_vision_ready)
+    loader.failed.connect(window.on_vision_failed)
+    if import_profiler is not None:
+        loader.finished.connect(lambda: import_profiler.report("after vision stack"))
+    loader.start()
+
+    if args.monitor:
+        monitor_server = MonitorServer(args.monitor_host, args.monitor_port)
+        if not monitor_server.start():
+            monitor_server = None
+
+    code = app.exec()
+    loader.wait()
+    if monitor_server is not None:
+        monitor_server.stop()
+    sys.exit(code)
 
 
 if __name__ == "__main__":